@@ -5,8 +5,9 @@ with Language Learning Models (LLMs). It is designed to be implementation-agnost
 allowing different LLM providers to implement these interfaces.
 """
 
-from .llm_backend import LLMBackend
+from .llm_backend import NO_RESPONSE, LLMBackend
 
 __all__ = [
+    "NO_RESPONSE",
     "LLMBackend",
 ]
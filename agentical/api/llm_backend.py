@@ -1,6 +1,7 @@
 """LLMBackend abstract base class."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from typing import Generic, TypeVar
 
 from mcp.types import Tool as MCPTool, Resource as MCPResource, Prompt as MCPPrompt
@@ -8,6 +9,9 @@ from mcp.types import Tool as MCPTool, Resource as MCPResource, Prompt as MCPPro
 # Type variables for LLM-specific context
 Context = TypeVar("Context")
 
+# Returned by backends when the model produced no text to answer with
+NO_RESPONSE = "No response generated"
+
 
 class LLMBackend(ABC, Generic[Context]):
     """Abstract base class for LLM backends.
@@ -24,7 +28,7 @@ class LLMBackend(ABC, Generic[Context]):
     async def process_query(
         self,
         query: str,
-        tools: list[MCPTool],
+        tools: Collection[MCPTool],
         resources: list[MCPResource],
         prompts: list[MCPPrompt],
         execute_tool: callable,
@@ -34,7 +38,9 @@ class LLMBackend(ABC, Generic[Context]):
 
         Args:
             query: The user's input query
-            tools: List of available MCP tools
+            tools: Available MCP tools. This may be a read-only snapshot rather
+                than a list; implementations that need a list should call
+                list(tools)
             resources: List of available MCP resources
             prompts: List of available MCP prompts
             execute_tool: Callback function to execute a tool
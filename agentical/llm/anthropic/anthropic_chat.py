@@ -1,11 +1,11 @@
 """Anthropic implementation for chat interactions."""
 
-import json
+import asyncio
 import logging
 import os
 import time
 import traceback
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any
 
 import anthropic
@@ -14,25 +14,42 @@ from mcp.types import Tool as MCPTool
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import Resource as MCPResource
 
-from agentical.api.llm_backend import LLMBackend
+from agentical.api.llm_backend import NO_RESPONSE, LLMBackend
 from agentical.utils.log_utils import sanitize_log_message
 
 from .schema_adapter import SchemaAdapter
 
 logger = logging.getLogger(__name__)
 
+# Converters for the conversation roles that become Anthropic messages; system
+# messages are passed separately
+_MESSAGE_BUILDERS: dict[str, Callable[[str], dict[str, Any]]] = {
+    "user": SchemaAdapter.create_user_message,
+    "assistant": SchemaAdapter.create_assistant_message,
+}
+
 
 class AnthropicBackend(LLMBackend[list[dict[str, Any]]]):
     """Anthropic implementation for chat interactions."""
 
     DEFAULT_MODEL = "claude-3-opus-20240229"
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache_system: bool = True,
+        cache_tools: bool = True,
+        cache_messages: bool = True,
+    ):
         """Initialize the Anthropic backend.
 
         Args:
             api_key: Optional Anthropic API key. If not provided, will look for
                 ANTHROPIC_API_KEY env var.
+            cache_system: Mark the system prompt for Anthropic prompt caching
+            cache_tools: Mark the tool definitions for Anthropic prompt caching
+            cache_messages: Mark the latest message on every request, so tool
+                use follow-ups reuse the cached conversation prefix
 
         Raises:
             ValueError: If API key is not provided or found in environment
@@ -52,6 +69,9 @@ class AnthropicBackend(LLMBackend[list[dict[str, Any]]]):
             self.client = anthropic.AsyncAnthropic(api_key=api_key)
             self.model = os.getenv("ANTHROPIC_MODEL", self.DEFAULT_MODEL)
             self.schema_adapter = SchemaAdapter()
+            self.cache_system = cache_system
+            self.cache_tools = cache_tools
+            self.cache_messages = cache_messages
             logger.info(
                 "Initialized Anthropic client",
                 extra={"model": self.model, "api_key_length": len(api_key)},
@@ -74,10 +94,52 @@ class AnthropicBackend(LLMBackend[list[dict[str, Any]]]):
         """
         return self.schema_adapter.convert_mcp_tools_to_anthropic(tools)
 
+    @staticmethod
+    async def _execute_tool_call(
+        execute_tool: Callable[[str, dict[str, Any]], CallToolResult],
+        tool_name: str,
+        tool_params: dict[str, Any],
+    ) -> tuple[Any, str | None]:
+        """Execute one tool call without raising.
+
+        Args:
+            execute_tool: Function to execute a tool call
+            tool_name: Name of the tool
+            tool_params: Arguments for the tool
+
+        Returns:
+            Tuple of (tool response, None) on success or (None, error message)
+        """
+        tool_start_time = time.time()
+        try:
+            tool_response = await execute_tool(tool_name, tool_params)
+        except Exception as e:
+            tool_duration = time.time() - tool_start_time
+            logger.error(
+                "Tool execution failed",
+                extra={
+                    "tool_name": tool_name,
+                    "error": sanitize_log_message(str(e)),
+                    "duration_ms": int(tool_duration * 1000),
+                    "traceback": traceback.format_exc(),
+                },
+            )
+            return None, str(e)
+
+        tool_duration = time.time() - tool_start_time
+        logger.debug(
+            "Tool execution completed",
+            extra={
+                "tool_name": tool_name,
+                "duration_ms": int(tool_duration * 1000),
+            },
+        )
+        return tool_response, None
+
     async def process_query(
         self,
         query: str,
-        tools: list[MCPTool],
+        tools: Collection[MCPTool],
         resources: list[MCPResource],
         prompts: list[MCPPrompt],
         execute_tool: Callable[[str, dict[str, Any]], CallToolResult],
@@ -111,30 +173,30 @@ class AnthropicBackend(LLMBackend[list[dict[str, Any]]]):
                     "has_context": context is not None,
                 },
             )
-            # Initialize or use existing conversation context
-            messages = list(context) if context else []
-
             # Extract system message if present and convert other messages
             system_content = None
             anthropic_messages = []
 
-            for msg in messages:
-                if msg["role"] == "system":
+            for msg in context or ():
+                role = msg["role"]
+                build_message = _MESSAGE_BUILDERS.get(role)
+                if build_message is not None:
+                    anthropic_messages.append(build_message(msg["content"]))
+                elif role == "system":
                     system_content = msg["content"]
-                elif msg["role"] == "user":
-                    anthropic_messages.append(
-                        self.schema_adapter.create_user_message(msg["content"])
-                    )
-                elif msg["role"] == "assistant":
-                    anthropic_messages.append(
-                        self.schema_adapter.create_assistant_message(msg["content"])
-                    )
 
             # Add the new user query
             anthropic_messages.append(self.schema_adapter.create_user_message(query))
 
             # Convert tools to Anthropic format
             anthropic_tools = self.schema_adapter.convert_mcp_tools_to_anthropic(tools)
+            if self.cache_tools and anthropic_tools:
+                # Everything up to the marked tool is cached. Mark a copy, since
+                # converted tools are shared across queries.
+                anthropic_tools = [
+                    *anthropic_tools[:-1],
+                    self.schema_adapter.with_cache_control(anthropic_tools[-1]),
+                ]
 
             # Set default system content if none provided
             if not system_content:
@@ -153,15 +215,30 @@ class AnthropicBackend(LLMBackend[list[dict[str, Any]]]):
                 if system_content
                 else None
             )
+            if self.cache_system and system_blocks:
+                system_blocks[-1] = self.schema_adapter.with_cache_control(
+                    system_blocks[-1]
+                )
 
+            cached_block = None
             while True:  # Continue until we get a response without tool calls
+                if self.cache_messages:
+                    # Move the breakpoint to the newest message; Anthropic
+                    # allows only a few breakpoints per request
+                    if cached_block is not None:
+                        cached_block.pop("cache_control", None)
+                    cached_block = anthropic_messages[-1]["content"][-1]
+                    cached_block["cache_control"] = dict(
+                        self.schema_adapter.CACHE_CONTROL
+                    )
+
                 # Prepare API call parameters
                 kwargs = {
                     "model": self.model,
                     "messages": anthropic_messages,
                     "tools": anthropic_tools,
                     "max_tokens": 4096,
-                    "tool_choice": {"type": "auto", "disable_parallel_tool_use": True},
+                    "tool_choice": {"type": "auto"},
                 }
                 if system_blocks:
                     kwargs["system"] = system_blocks
@@ -170,60 +247,44 @@ class AnthropicBackend(LLMBackend[list[dict[str, Any]]]):
                 response = await self.client.messages.create(**kwargs)
 
                 # Extract tool calls
-                tool_calls = self.schema_adapter.extract_tool_calls(response)
+                tool_uses = [
+                    block for block in response.content if block.type == "tool_use"
+                ]
+                texts = [
+                    block.text for block in response.content if block.type == "text"
+                ]
 
                 # If no tool calls, return the final response
-                if not tool_calls:
-                    result_text = []
-                    for block in response.content:
-                        if block.type == "text":
-                            answer = self.schema_adapter.extract_answer(block.text)
-                            result_text.append(answer)
-                    return " ".join(result_text) or "No response generated"
-
-                # Handle each tool call
-                for tool_name, tool_params in tool_calls:
-                    try:
-                        # Execute the tool
-                        tool_start_time = time.time()
-                        tool_response = await execute_tool(tool_name, tool_params)
-                        tool_duration = time.time() - tool_start_time
-                        logger.debug(
-                            "Tool execution completed",
-                            extra={
-                                "tool_name": tool_name,
-                                "duration_ms": int(tool_duration * 1000),
-                            },
-                        )
-
-                        # Add tool call and response to messages
-                        anthropic_messages.append(
-                            self.schema_adapter.create_assistant_message(
-                                f"I'll use the {tool_name} tool with input: "
-                                f"{json.dumps(tool_params)}"
-                            )
-                        )
-                        anthropic_messages.append(
-                            self.schema_adapter.create_tool_response_message(
-                                tool_name=tool_name, result=tool_response
-                            )
-                        )
-                    except Exception as e:
-                        tool_duration = time.time() - tool_start_time
-                        logger.error(
-                            "Tool execution failed",
-                            extra={
-                                "tool_name": tool_name,
-                                "error": sanitize_log_message(str(e)),
-                                "duration_ms": int(tool_duration * 1000),
-                                "traceback": traceback.format_exc(),
-                            },
-                        )
-                        anthropic_messages.append(
-                            self.schema_adapter.create_tool_response_message(
-                                tool_name=tool_name, error=str(e)
+                if not tool_uses:
+                    return (
+                        " ".join(map(self.schema_adapter.extract_answer, texts))
+                        or NO_RESPONSE
+                    )
+
+                # Run the tool calls concurrently and answer each one by id
+                outcomes = await asyncio.gather(
+                    *(
+                        self._execute_tool_call(execute_tool, block.name, block.input)
+                        for block in tool_uses
+                    )
+                )
+                # Keep any text the model wrote alongside its tool calls in the
+                # same assistant turn
+                anthropic_messages.append(
+                    self.schema_adapter.create_tool_use_message(
+                        tool_uses, " ".join(texts)
+                    )
+                )
+                anthropic_messages.append(
+                    self.schema_adapter.create_tool_results_message(
+                        [
+                            (block.id, tool_response, error)
+                            for block, (tool_response, error) in zip(
+                                tool_uses, outcomes
                             )
-                        )
+                        ]
+                    )
+                )
 
                 # Continue the loop to handle more tool calls
 
@@ -4,9 +4,11 @@ import logging
 import re
 from typing import Any, ClassVar
 
-from anthropic.types import Message, MessageParam
+from anthropic.types import Message, MessageParam, ToolUseBlock
 from mcp.types import Tool as MCPTool
 
+from agentical.utils.identity_cache import IdentityCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,9 @@ class SchemaAdapter:
         "additionalProperties",
     }
 
+    # Marks the end of a prompt prefix that Anthropic may cache server side
+    CACHE_CONTROL: ClassVar[dict[str, str]] = {"type": "ephemeral"}
+
     @staticmethod
     def extract_answer(text: str) -> str:
         """Extract the content within <answer> tags, or return the full text if not
@@ -35,43 +40,61 @@ class SchemaAdapter:
         match = re.search(r"<answer>(.*?)</answer>", text, re.DOTALL)
         return match.group(1).strip() if match else text
 
+    def __init__(self):
+        """Initialize the adapter."""
+        self._converted_tools: IdentityCache[dict[str, Any]] = IdentityCache()
+
+    def convert_mcp_tool_to_anthropic(self, tool: MCPTool) -> dict[str, Any]:
+        """Convert a single MCP tool to Anthropic format.
+
+        Args:
+            tool: MCP tool to convert
+
+        Returns:
+            Tool in Anthropic format
+        """
+        # Create Anthropic tool format - matching reference implementation exactly
+        formatted_tool = {
+            "type": "custom",
+            "name": tool.name,
+            "description": tool.description,  # description at top level
+            "input_schema": {  # input_schema at top level
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        }
+
+        # Get and clean the tool's JSON schema
+        schema = self.clean_schema(tool.inputSchema)
+        logger.debug(
+            "Cleaned tool schema",
+            extra={"tool_name": tool.name, "schema": schema},
+        )
+
+        # Copy over properties and required fields
+        if "properties" in schema:
+            formatted_tool["input_schema"]["properties"] = schema["properties"]
+        if "required" in schema:
+            formatted_tool["input_schema"]["required"] = schema["required"]
+
+        return formatted_tool
+
     def convert_mcp_tools_to_anthropic(
         self, tools: list[MCPTool]
     ) -> list[dict[str, Any]]:
-        """Convert MCP tools to Anthropic format."""
+        """Convert MCP tools to Anthropic format.
+
+        Each tool is converted once and reused for as long as the same tool
+        object is passed in, so repeated queries skip the schema cleaning.
+        """
         logger.debug(
             "Converting MCP tools to Anthropic format", extra={"num_tools": len(tools)}
         )
-        formatted_tools = []
-
-        for tool in tools:
-            # Create Anthropic tool format - matching reference implementation exactly
-            formatted_tool = {
-                "type": "custom",
-                "name": tool.name,
-                "description": tool.description,  # description at top level
-                "input_schema": {  # input_schema at top level
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                },
-            }
-
-            # Get and clean the schema from the tool's parameters
-            if hasattr(tool, "parameters"):
-                schema = self.clean_schema(tool.parameters)
-                logger.debug(
-                    "Cleaned tool schema",
-                    extra={"tool_name": tool.name, "schema": schema},
-                )
-
-                # Copy over properties and required fields
-                if "properties" in schema:
-                    formatted_tool["input_schema"]["properties"] = schema["properties"]
-                if "required" in schema:
-                    formatted_tool["input_schema"]["required"] = schema["required"]
-
-            formatted_tools.append(formatted_tool)
+        formatted_tools = [
+            self._converted_tools.get(tool, self.convert_mcp_tool_to_anthropic)
+            for tool in tools
+        ]
 
         logger.debug(
             "Tool conversion completed", extra={"num_tools": len(formatted_tools)}
@@ -114,6 +137,18 @@ class SchemaAdapter:
         """Create a system message in Anthropic format."""
         return [{"type": "text", "text": content}]
 
+    @classmethod
+    def with_cache_control(cls, block: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of a tool or content block marked as a cache breakpoint.
+
+        Args:
+            block: Tool definition, system block or message content block
+
+        Returns:
+            A shallow copy of the block with cache_control set
+        """
+        return {**block, "cache_control": dict(cls.CACHE_CONTROL)}
+
     @staticmethod
     def create_assistant_message(content: str) -> MessageParam:
         """Create an assistant message in Anthropic format."""
@@ -131,6 +166,56 @@ class SchemaAdapter:
         )
         return {"role": "user", "content": [{"type": "text", "text": content}]}
 
+    @staticmethod
+    def create_tool_use_message(
+        tool_uses: list[ToolUseBlock], text: str = ""
+    ) -> MessageParam:
+        """Create the assistant turn that requested tool calls in Anthropic format.
+
+        Args:
+            tool_uses: Tool use blocks from the model's response
+            text: Text the model wrote alongside the tool calls, if any
+
+        Returns:
+            Assistant message with the text followed by the tool use blocks,
+            which the matching tool results refer to by id
+        """
+        content: list[dict[str, Any]] = [{"type": "text", "text": text}] if text else []
+        content.extend(
+            {
+                "type": "tool_use",
+                "id": block.id,
+                "name": block.name,
+                "input": block.input,
+            }
+            for block in tool_uses
+        )
+        return {"role": "assistant", "content": content}
+
+    @staticmethod
+    def create_tool_results_message(
+        results: list[tuple[str, Any | None, str | None]],
+    ) -> MessageParam:
+        """Create the user turn carrying tool results in Anthropic format.
+
+        Args:
+            results: (tool use id, result, error) for each tool call; error is
+                None when the call succeeded
+
+        Returns:
+            User message with one tool_result block per tool call
+        """
+        content = []
+        for tool_use_id, result, error in results:
+            block = {"type": "tool_result", "tool_use_id": tool_use_id}
+            if error is not None:
+                block["content"] = error
+                block["is_error"] = True
+            else:
+                block["content"] = str(result)
+            content.append(block)
+        return {"role": "user", "content": content}
+
     @staticmethod
     def extract_tool_calls(response: Message) -> list[tuple[str, dict[str, Any]]]:
         """Extract tool calls from an Anthropic message."""
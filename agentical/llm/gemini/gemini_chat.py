@@ -3,7 +3,7 @@
 import logging
 import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any
 
 from google import genai
@@ -12,7 +12,7 @@ from mcp.types import Tool as MCPTool
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import Resource as MCPResource
 
-from agentical.api.llm_backend import LLMBackend
+from agentical.api.llm_backend import NO_RESPONSE, LLMBackend
 from agentical.utils.log_utils import sanitize_log_message
 
 from .schema_adapter import SchemaAdapter
@@ -87,7 +87,7 @@ class GeminiBackend(LLMBackend[list[dict[str, Any]]]):
     async def process_query(
         self,
         query: str,
-        tools: list[MCPTool],
+        tools: Collection[MCPTool],
         resources: list[MCPResource],
         prompts: list[MCPPrompt],
         execute_tool: Callable[[str, dict[str, Any]], CallToolResult],
@@ -143,7 +143,7 @@ class GeminiBackend(LLMBackend[list[dict[str, Any]]]):
 
                 if not response.candidates:
                     logger.warning("No response candidates generated")
-                    return "No response generated"
+                    return NO_RESPONSE
 
                 has_tool_calls = False
                 final_text = []
@@ -207,7 +207,7 @@ class GeminiBackend(LLMBackend[list[dict[str, Any]]]):
                         "Query completed without tool calls",
                         extra={"duration_ms": int(duration * 1000)},
                     )
-                    return " ".join(final_text) or "No response generated"
+                    return " ".join(final_text) or NO_RESPONSE
 
                 # Continue the loop to handle more tool calls
 
@@ -7,6 +7,8 @@ from google.genai.types import Tool as GeminiTool
 from mcp.types import CallToolResult
 from mcp.types import Tool as MCPTool
 
+from agentical.utils.identity_cache import IdentityCache
+
 
 class SchemaAdapter:
     """Adapter for converting between MCP and Gemini schemas."""
@@ -19,6 +21,9 @@ class SchemaAdapter:
         "additionalProperties",
     }
 
+    # Converted tools, shared because the conversion methods are static
+    _converted_tools: ClassVar[IdentityCache[GeminiTool]] = IdentityCache()
+
     @staticmethod
     def clean_schema(schema: dict[str, Any]) -> dict[str, Any]:
         """Recursively removes unsupported fields from the JSON schema.
@@ -123,8 +128,15 @@ class SchemaAdapter:
 
         Returns:
             List of converted Gemini Tools
+
+        Note:
+            Each tool is converted once and reused for as long as the same
+            tool object is passed in.
         """
-        return [SchemaAdapter.convert_mcp_tool_to_gemini(tool) for tool in tools]
+        cache = SchemaAdapter._converted_tools
+        return [
+            cache.get(tool, SchemaAdapter.convert_mcp_tool_to_gemini) for tool in tools
+        ]
 
     @staticmethod
     def create_user_content(query: str) -> Content:
@@ -1,9 +1,10 @@
 """OpenAI implementation for chat interactions."""
 
+import asyncio
 import logging
 import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any
 
 import openai
@@ -88,10 +89,51 @@ class OpenAIBackend(LLMBackend[list[dict[str, str]]]):
             )
             raise
 
+    @staticmethod
+    async def _execute_tool_call(
+        execute_tool: Callable[[str, dict[str, Any]], CallToolResult],
+        function_name: str,
+        function_args: dict[str, Any],
+    ) -> CallToolResult | str:
+        """Execute one tool call without raising.
+
+        Args:
+            execute_tool: Function to execute a tool call
+            function_name: Name of the tool
+            function_args: Arguments for the tool
+
+        Returns:
+            The tool response, or an error string if execution failed
+        """
+        tool_start = time.time()
+        try:
+            function_response = await execute_tool(function_name, function_args)
+        except Exception as e:
+            tool_duration = time.time() - tool_start
+            logger.error(
+                "Tool execution failed",
+                extra={
+                    "tool_name": function_name,
+                    "error": sanitize_log_message(str(e)),
+                    "duration_ms": int(tool_duration * 1000),
+                },
+            )
+            return f"Error: {e!s}"
+
+        tool_duration = time.time() - tool_start
+        logger.debug(
+            "Tool execution completed",
+            extra={
+                "tool_name": function_name,
+                "duration_ms": int(tool_duration * 1000),
+            },
+        )
+        return function_response
+
     async def process_query(
         self,
         query: str,
-        tools: list[MCPTool],
+        tools: Collection[MCPTool],
         resources: list[MCPResource],
         prompts: list[MCPPrompt],
         execute_tool: Callable[[str, dict[str, Any]], CallToolResult],
@@ -189,36 +231,18 @@ class OpenAIBackend(LLMBackend[list[dict[str, str]]]):
                     )
                 )
 
-                # Handle each tool call
-                for tool_call, (function_name, function_args) in zip(
-                    message.tool_calls, tool_calls
-                ):
-                    # Execute the tool
-                    tool_start = time.time()
-                    try:
-                        function_response = await execute_tool(
-                            function_name, function_args
-                        )
-                        tool_duration = time.time() - tool_start
-                        logger.debug(
-                            "Tool execution completed",
-                            extra={
-                                "tool_name": function_name,
-                                "duration_ms": int(tool_duration * 1000),
-                            },
+                # Run the tool calls concurrently, then record them in call order
+                function_responses = await asyncio.gather(
+                    *(
+                        self._execute_tool_call(
+                            execute_tool, function_name, function_args
                         )
-                    except Exception as e:
-                        tool_duration = time.time() - tool_start
-                        logger.error(
-                            "Tool execution failed",
-                            extra={
-                                "tool_name": function_name,
-                                "error": sanitize_log_message(str(e)),
-                                "duration_ms": int(tool_duration * 1000),
-                            },
-                        )
-                        function_response = f"Error: {e!s}"
-
+                        for function_name, function_args in tool_calls
+                    )
+                )
+                for tool_call, function_response in zip(
+                    message.tool_calls, function_responses
+                ):
                     # Add tool response to conversation
                     messages.append(
                         self.schema_adapter.create_tool_response_message(
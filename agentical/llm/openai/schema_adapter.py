@@ -7,6 +7,8 @@ from typing import Any, ClassVar
 from mcp.types import CallToolResult
 from mcp.types import Tool as MCPTool
 
+from agentical.utils.identity_cache import IdentityCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,10 @@ class SchemaAdapter:
         "additionalProperties",
     }
 
+    def __init__(self):
+        """Initialize the adapter."""
+        self._converted_tools: IdentityCache[dict[str, Any]] = IdentityCache()
+
     def clean_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
         """Clean a JSON schema for OpenAI compatibility."""
         return self._clean_schema_internal(schema)
@@ -81,8 +87,15 @@ class SchemaAdapter:
 
         Returns:
             List of tools in OpenAI format
+
+        Note:
+            Each tool is converted once and reused for as long as the same
+            tool object is passed in.
         """
-        return [self.convert_mcp_tool_to_openai(tool) for tool in tools]
+        return [
+            self._converted_tools.get(tool, self.convert_mcp_tool_to_openai)
+            for tool in tools
+        ]
 
     @staticmethod
     def create_user_message(query: str) -> dict[str, str]:
@@ -8,10 +8,12 @@ with MCP tools, resources, and prompts directly.
 from .provider import MCPToolProvider
 from .resource_registry import ResourceRegistry
 from .prompt_registry import PromptRegistry
+from .sync_provider import MCPClientWrapper
 from .tool_registry import ToolRegistry
 
 __all__ = [
     "MCPToolProvider",
+    "MCPClientWrapper",
     "ResourceRegistry",
     "PromptRegistry",
     "ToolRegistry",
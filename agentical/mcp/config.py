@@ -5,17 +5,23 @@ for the MCP tool provider. It follows the dependency inversion principle to
 decouple configuration sources from the provider implementation.
 """
 
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Protocol
 
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from agentical.mcp.schemas import MCPConfig, ServerConfig
 
 logger = logging.getLogger(__name__)
 
+# Parsed configurations keyed by (path, mtime_ns, size) so unchanged files are
+# not re-read and re-validated on every load
+_CONFIG_CACHE_SIZE = 8
+_config_cache: dict[tuple[str, int, int], dict[str, ServerConfig]] = {}
+
 
 class MCPConfigProvider(Protocol):
     """Protocol defining how MCP configurations should be loaded.
@@ -56,6 +62,11 @@ class FileBasedMCPConfigProvider(MCPConfigProvider):
 
     Attributes:
         config_path: Path to the configuration file
+
+    Note:
+        Parsed configurations are cached by path, modification time and size,
+        so repeated loads of an unchanged file skip parsing and validation.
+        Each load returns fresh copies of the cached configurations.
     """
 
     def __init__(self, config_path: str | Path):
@@ -78,19 +89,49 @@ class FileBasedMCPConfigProvider(MCPConfigProvider):
         """
         logger.info("Loading MCP configuration from: %s", self.config_path)
         try:
-            with open(self.config_path) as f:
-                raw_config = json.load(f)
+            stat = os.stat(self.config_path)
+            cache_key = (os.fspath(self.config_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # Let open() below report the problem
+            cache_key = None
+
+        cached = _config_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.debug("Using cached configuration for: %s", self.config_path)
+            return {
+                name: server_config.model_copy(deep=True)
+                for name, server_config in cached.items()
+            }
+
+        try:
+            with open(self.config_path, "rb") as f:
+                content = f.read()
+
+            # pydantic-core's JSON parser is several times faster than json.load
+            # and is already installed with pydantic
+            try:
+                raw_config = from_json(content)
+            except ValueError as e:
+                logger.error("Failed to parse configuration file: %s", str(e))
+                raise ConfigurationError(f"Invalid JSON in config file: {e!s}")
 
             # Parse and validate configuration using Pydantic schema
-            config = MCPConfig(servers=raw_config)
+            config = MCPConfig.model_validate({"servers": raw_config})
             logger.info(
                 "Successfully loaded configuration with %d servers", len(config.servers)
             )
+            if cache_key:
+                if len(_config_cache) >= _CONFIG_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del _config_cache[next(iter(_config_cache))]
+                _config_cache[cache_key] = {
+                    name: server_config.model_copy(deep=True)
+                    for name, server_config in config.servers.items()
+                }
             return config.servers
 
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse configuration file: %s", str(e))
-            raise ConfigurationError(f"Invalid JSON in config file: {e!s}")
+        except ConfigurationError:
+            raise
         except ValidationError as e:
             logger.error("Invalid configuration format: %s", str(e))
             raise ConfigurationError(f"Configuration validation failed: {e!s}")
@@ -108,9 +149,10 @@ class DictBasedMCPConfigProvider(MCPConfigProvider):
         Args:
             config: Dictionary mapping server names to their configurations
         """
-        # Create a deep copy of the config to ensure immutability
+        # Create a deep copy of the config to ensure immutability. The configs
+        # are already validated, so copy them instead of re-validating a dump.
         self._config = {
-            name: ServerConfig(**server_config.model_dump())
+            name: server_config.model_copy(deep=True)
             for name, server_config in config.items()
         }
 
@@ -122,6 +164,6 @@ class DictBasedMCPConfigProvider(MCPConfigProvider):
         """
         # Return a deep copy to prevent modifications
         return {
-            name: ServerConfig(**server_config.model_dump())
+            name: server_config.model_copy(deep=True)
             for name, server_config in self._config.items()
         }
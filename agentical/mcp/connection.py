@@ -5,7 +5,7 @@ handling both connection lifecycle and health monitoring.
 
 This module provides a centralized connection management system for MCP
 (Machine Control Protocol) servers.
-It handles both WebSocket and stdio-based connections, with features including:
+It handles stdio-based connections, with features including:
 - Automatic connection retry with exponential backoff
 - Resource cleanup and management
 - Connection state tracking
@@ -21,9 +21,7 @@ Example:
     async def connect_to_server():
         async with AsyncExitStack() as stack:
             manager = MCPConnectionManager(stack)
-            config = ServerConfig(
-                command="server_command", args=["--port", "8080"], is_websocket=False
-            )
+            config = ServerConfig(command="server_command", args=["--port", "8080"])
             try:
                 session = await manager.connect("my_server", config)
                 # Use session...
@@ -32,18 +30,22 @@ Example:
     ```
 
 Implementation Notes:
-    - Uses AsyncExitStack for proper async resource management
+    - Uses a per-server AsyncExitStack for proper async resource management
     - Implements automatic retry with backoff for connection stability
     - Maintains connection state to prevent duplicate connections
-    - Handles both WebSocket and stdio server types
+    - Launches servers as subprocesses and talks to them over stdio
     - Provides comprehensive error handling and logging
 """
 
+import asyncio
 import logging
+import random
+from collections.abc import Iterator, Mapping
 from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Any
 
-import backoff
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
@@ -58,23 +60,69 @@ from agentical.utils.log_utils import sanitize_log_message
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ServerRecord:
+    """Everything the connection manager holds for one connected server.
+
+    Attributes:
+        session: The initialized client session
+        stdio: stdio read stream
+        write: stdio write stream
+        config: Configuration used to connect, kept for reconnection
+        owner: Task that owns the server's exit stack
+        stop: Event that tells the owner task to close the exit stack
+    """
+
+    session: ClientSession
+    stdio: Any
+    write: Any
+    config: ServerConfig | None = None
+    owner: asyncio.Task | None = None
+    stop: asyncio.Event | None = None
+
+
+class _RecordFieldView(Mapping[str, Any]):
+    """Read-only mapping of server name to one field of its ServerRecord."""
+
+    def __init__(self, records: dict[str, ServerRecord], field: str):
+        self._records = records
+        self._field = field
+
+    def __getitem__(self, server_name: str) -> Any:
+        return getattr(self._records[server_name], self._field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class MCPConnectionManager:
     """Manages connections to MCP servers.
 
     This class provides a centralized way to manage connections to MCP servers,
-    handling connection establishment, maintenance, and cleanup. It supports both
-    WebSocket and stdio-based connections, with automatic retry capabilities.
+    handling connection establishment, maintenance, and cleanup. It supports
+    stdio-based connections, with automatic retry capabilities.
 
     Attributes:
         MAX_RETRIES (int): Maximum number of connection retry attempts
         BASE_DELAY (float): Base delay in seconds between retry attempts
-        sessions (Dict[str, ClientSession]): Active server sessions
-        stdios (Dict[str, Any]): stdio transport handlers
-        writes (Dict[str, Any]): Write transport handlers
-        _configs (Dict[str, ServerConfig]): Store configs for reconnection
+        servers (Dict[str, ServerRecord]): Connected servers and their state
+        sessions (Mapping[str, ClientSession]): Read-only view of active sessions
+        stdios (Mapping[str, Any]): Read-only view of stdio transport handlers
+        writes (Mapping[str, Any]): Read-only view of write transport handlers
 
     Implementation Notes:
-        - Uses AsyncExitStack for proper async context management
+        - Uses a dedicated AsyncExitStack per server so a single server can be
+          torn down without affecting the others
+        - Each stack is entered and closed by its own owner task, because the
+          stdio transport's cancel scope must be exited in the task that
+          entered it. This makes connecting from concurrent tasks and cleaning
+          up from any task safe.
         - Implements exponential backoff for connection retries
         - Maintains connection state to prevent duplicate connections
         - Provides comprehensive error handling and logging
@@ -84,7 +132,9 @@ class MCPConnectionManager:
         ```python
         manager = MCPConnectionManager(AsyncExitStack())
         try:
-            session = await manager.connect("server1", ServerConfig(command="cmd", args=[]))
+            session = await manager.connect(
+                "server1", ServerConfig(command="cmd", args=[])
+            )
             # Use session...
         finally:
             await manager.cleanup("server1")
@@ -106,12 +156,17 @@ class MCPConnectionManager:
         Note:
             The exit_stack should be managed by the caller to ensure proper
             cleanup order, especially when used with other async resources.
+            Server transports and sessions are not entered into it; each server
+            gets its own stack so that ``cleanup`` releases it immediately.
         """
         self.exit_stack = exit_stack
-        self.sessions: dict[str, ClientSession] = {}
-        self.stdios: dict[str, Any] = {}
-        self.writes: dict[str, Any] = {}
-        self._configs: dict[str, ServerConfig] = {}  # Store configs for reconnection
+        self.servers: dict[str, ServerRecord] = {}
+        self._connecting: set[str] = set()
+        self.sessions: Mapping[str, ClientSession] = _RecordFieldView(
+            self.servers, "session"
+        )
+        self.stdios: Mapping[str, Any] = _RecordFieldView(self.servers, "stdio")
+        self.writes: Mapping[str, Any] = _RecordFieldView(self.servers, "write")
 
     def get_config(self, server_name: str) -> ServerConfig | None:
         """Get the stored configuration for a server.
@@ -122,62 +177,171 @@ class MCPConnectionManager:
         Returns:
             The server configuration if it exists, None otherwise
         """
-        return self._configs.get(server_name)
-
-    @backoff.on_exception(
-        backoff.expo,
-        (ConnectionError, TimeoutError),
-        max_tries=MAX_RETRIES,
-        base=BASE_DELAY,
-    )
+        record = self.servers.get(server_name)
+        return record.config if record else None
+
+    def is_connecting(self, server_name: str) -> bool:
+        """Check whether a connect for a server is still in progress.
+
+        Args:
+            server_name: Name of the server
+
+        Returns:
+            True if a connect for the server has not finished yet
+        """
+        return server_name in self._connecting
+
     async def _connect_with_retry(
-        self, server_name: str, server_params: StdioServerParameters
-    ) -> tuple[ClientSession, Any, Any]:
+        self,
+        server_name: str,
+        server_params: StdioServerParameters,
+        read_timeout: timedelta | None = None,
+    ) -> ServerRecord:
         """Attempt to connect to a server with exponential backoff retry.
 
         This method implements a retry mechanism with exponential backoff for
-        handling transient connection failures. It will retry up to MAX_RETRIES
-        times, with increasing delays between attempts.
+        handling transient connection failures. It makes up to MAX_RETRIES
+        attempts, sleeping a random ("full jitter") delay of up to BASE_DELAY
+        seconds, doubling after each failure, between attempts.
 
         Args:
             server_name: Name of the server to connect to
             server_params: Server connection parameters including command and args
+            read_timeout: Maximum time to wait for each request's response, or
+                None to wait indefinitely
 
         Returns:
-            Tuple containing:
-                - ClientSession: The established session
-                - Any: stdio transport
-                - Any: write transport
+            Record of the established session, its transports and owner task
 
         Raises:
             ConnectionError: If all connection attempts fail
             TimeoutError: If connection attempts timeout
         """
-        try:
-            logger.debug("Establishing connection to %s", server_name)
-
-            # Enter contexts directly in the main exit stack
-            stdio_transport = await self.exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            stdio, write = stdio_transport
-
-            # Initialize session
-            logger.debug("Initializing session for %s", server_name)
-            session = await self.exit_stack.enter_async_context(
-                ClientSession(stdio, write)
-            )
+        delay = self.BASE_DELAY
+        for attempt in range(1, self.MAX_RETRIES):
+            try:
+                return await self._connect_once(
+                    server_name, server_params, read_timeout
+                )
+            except (ConnectionError, TimeoutError):
+                logger.debug(
+                    "Retrying connection to %s (attempt %d of %d)",
+                    server_name,
+                    attempt + 1,
+                    self.MAX_RETRIES,
+                )
+                await asyncio.sleep(random.uniform(0, delay))
+                delay *= 2
+        # Final attempt propagates its error
+        return await self._connect_once(server_name, server_params, read_timeout)
+
+    async def _connect_once(
+        self,
+        server_name: str,
+        server_params: StdioServerParameters,
+        read_timeout: timedelta | None = None,
+    ) -> ServerRecord:
+        """Make a single connection attempt.
+
+        The attempt starts an owner task that enters the transport and session
+        into a fresh AsyncExitStack. The stack is closed if the attempt fails;
+        otherwise the task keeps it open until ``cleanup`` signals it to stop.
 
-            # Initialize session
-            await session.initialize()
+        Args:
+            server_name: Name of the server to connect to
+            server_params: Server connection parameters including command and args
+            read_timeout: Maximum time to wait for each request's response
 
-            return session, stdio, write
+        Returns:
+            Record of the established session, its transports and owner task
 
+        Raises:
+            ConnectionError: If the attempt fails
+        """
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(
+            self._own_connection(server_name, server_params, read_timeout, ready, stop),
+            name=f"mcp-connection-{server_name}",
+        )
+        try:
+            session, stdio, write = await ready
+        except asyncio.CancelledError:
+            # Let the owner close whatever it entered before giving up
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            raise
         except Exception as e:
             logger.error("Connection attempt failed for %s: %s", server_name, str(e))
-            # Let the exit stack handle cleanup of any initialized resources
+            await asyncio.gather(task, return_exceptions=True)
             raise ConnectionError(f"Failed to connect to server '{server_name}': {e!s}")
 
+        return ServerRecord(session, stdio, write, owner=task, stop=stop)
+
+    async def _own_connection(
+        self,
+        server_name: str,
+        server_params: StdioServerParameters,
+        read_timeout: timedelta | None,
+        ready: asyncio.Future,
+        stop: asyncio.Event,
+    ) -> None:
+        """Own a server's transport and session for the connection lifetime.
+
+        Args:
+            server_name: Name of the server
+            server_params: Server connection parameters
+            read_timeout: Maximum time to wait for each request's response
+            ready: Future resolved with (session, stdio, write) once initialized,
+                or with the exception that prevented it
+            stop: Event that ends the connection when set
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                logger.debug("Establishing connection to %s", server_name)
+
+                # Enter contexts in this server's own exit stack
+                stdio_transport = await stack.enter_async_context(
+                    stdio_client(server_params)
+                )
+                stdio, write = stdio_transport
+
+                # Initialize session
+                logger.debug("Initializing session for %s", server_name)
+                session = await stack.enter_async_context(
+                    ClientSession(stdio, write, read_timeout_seconds=read_timeout)
+                )
+
+                # Initialize session
+                await session.initialize()
+
+                ready.set_result((session, stdio, write))
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.debug("Error closing resources for %s: %s", server_name, str(e))
+        finally:
+            # A cancellation (e.g. the transport's task group tearing down when
+            # the server exits mid-initialize) must not leave the caller waiting
+            if not ready.done():
+                ready.set_exception(
+                    ConnectionError(f"Connection to {server_name} ended before ready")
+                )
+
+    async def _stop_owner(self, record: ServerRecord) -> None:
+        """Signal a server's owner task to close its stack and wait for it.
+
+        Args:
+            record: Record of the server to stop
+        """
+        if record.owner is None:
+            return
+        if record.stop is not None:
+            record.stop.set()
+        await asyncio.gather(record.owner, return_exceptions=True)
+
     async def connect(self, server_name: str, config: ServerConfig) -> ClientSession:
         """Connect to an MCP server.
 
@@ -193,7 +357,8 @@ class MCPConnectionManager:
 
         Raises:
             ConnectionError: If connection fails after retries
-            ValueError: If server is already connected or invalid configuration
+            ValueError: If server is already connected or connecting, or the
+                configuration is invalid
 
         Note:
             - Connections are automatically retried on failure
@@ -202,17 +367,21 @@ class MCPConnectionManager:
         if not server_name:
             raise ValueError("Server name cannot be empty")
 
-        if server_name in self.sessions:
+        if server_name in self.servers:
             raise ValueError(f"Server {server_name} is already connected")
+        if server_name in self._connecting:
+            raise ValueError(f"Server {server_name} is already connecting")
 
+        # Reserve the name so a concurrent connect cannot replace this record
+        self._connecting.add(server_name)
         try:
-            # Store config for potential reconnection
-            self._configs[server_name] = config
             return await self._handle_connection(server_name, config)
         except Exception as e:
             logger.error("Failed to connect to server %s: %s", server_name, str(e))
             await self.cleanup(server_name)
             raise ConnectionError(f"Failed to connect to server '{server_name}': {e!s}")
+        finally:
+            self._connecting.discard(server_name)
 
     async def _handle_connection(
         self, server_name: str, config: ServerConfig
@@ -237,22 +406,27 @@ class MCPConnectionManager:
             params["env"] = config.env
 
         server_params = StdioServerParameters(**params)
-        session, stdio, write = await self._connect_with_retry(
-            server_name, server_params
+        read_timeout = (
+            timedelta(seconds=config.timeout_seconds)
+            if config.timeout_seconds is not None
+            else None
+        )
+        record = await self._connect_with_retry(
+            server_name, server_params, read_timeout
         )
 
-        # Store connection details
-        self.sessions[server_name] = session
-        self.stdios[server_name] = stdio
-        self.writes[server_name] = write
+        # Store connection details, and the config for potential reconnection
+        record.config = config
+        self.servers[server_name] = record
 
-        return session
+        return record.session
 
     async def cleanup(self, server_name: str) -> None:
         """Clean up resources for a specific server.
 
         Properly cleans up all resources associated with a server connection,
-        including the session, stdio transport, and write handler.
+        including the session, stdio transport, and write handler, by closing
+        the server's own exit stack.
 
         Args:
             server_name: Name of the server to clean up
@@ -261,49 +435,19 @@ class MCPConnectionManager:
             - Safe to call multiple times
             - Handles cleanup errors gracefully
             - Removes server from internal tracking
-            - Session cleanup handled by AsyncExitStack
+            - Session and transport cleanup handled by the server's AsyncExitStack
         """
         logger.debug("Cleaning up resources for server: %s", server_name)
 
+        # Drop the record first so the server is no longer considered active
+        record = self.servers.pop(server_name, None)
         try:
-            # Remove session reference - cleanup handled by AsyncExitStack
-            if server_name in self.sessions:
-                del self.sessions[server_name]
-
-            # Close stdio if it exists and is not None
-            if server_name in self.stdios:
-                stdio = self.stdios[server_name]
-                if stdio is not None and hasattr(stdio, "close"):
-                    try:
-                        await stdio.close()
-                    except Exception as e:
-                        logger.debug(
-                            "Error closing stdio for %s: %s", server_name, str(e)
-                        )
-                del self.stdios[server_name]
-
-            # Close write if it exists and is not None
-            if server_name in self.writes:
-                write = self.writes[server_name]
-                if write is not None and hasattr(write, "close"):
-                    try:
-                        await write.close()
-                    except Exception as e:
-                        logger.debug(
-                            "Error closing write for %s: %s", server_name, str(e)
-                        )
-                del self.writes[server_name]
-
-            if server_name in self._configs:
-                del self._configs[server_name]
-
+            # The owner task exits the session and the stdio transport (LIFO)
+            if record is not None:
+                await self._stop_owner(record)
         except Exception as e:
             logger.error("Error during cleanup for %s: %s", server_name, str(e))
         finally:
-            # Ensure all references are removed
-            self.sessions.pop(server_name, None)
-            self.stdios.pop(server_name, None)
-            self.writes.pop(server_name, None)
             logger.debug("Cleanup completed for server: %s", server_name)
 
     async def cleanup_all(self) -> None:
@@ -316,19 +460,18 @@ class MCPConnectionManager:
             - Safe to call multiple times
             - Handles cleanup errors gracefully
             - Cleans up all server resources
+            - Servers are closed concurrently, since each one is owned by an
+              independent task
         """
         logger.debug("Cleaning up all server resources")
 
         try:
-            # Close all sessions
-            for server_name in list(self.sessions.keys()):
-                await self.cleanup(server_name)
-
-            # Clear all references - actual cleanup handled by AsyncExitStack
-            self.sessions.clear()
-            self.stdios.clear()
-            self.writes.clear()
-            self._configs.clear()
+            await asyncio.gather(
+                *(self.cleanup(server_name) for server_name in list(self.servers)),
+                return_exceptions=True,
+            )
+
+            self.servers.clear()
             logger.debug("All server resources cleaned up")
         except Exception as e:
             logger.error("Error during cleanup_all: %s", str(e))
@@ -383,11 +526,15 @@ class MCPConnectionService(ServerReconnector, ServerCleanupHandler):
 
         Raises:
             ConnectionError: If connection fails
-            ValueError: If server name is empty
+            ValueError: If server name is empty or the server is still connecting
         """
         if not server_name:
             raise ValueError("Server name cannot be empty")
 
+        # Reject a duplicate before it marks the pending connection failed
+        if self._connection_manager.is_connecting(server_name):
+            raise ValueError(f"Server {server_name} is already connecting")
+
         try:
             # Register with health monitor first
             self._health_monitor.register_server(server_name)
@@ -422,7 +569,7 @@ class MCPConnectionService(ServerReconnector, ServerCleanupHandler):
     async def reconnect(self, server_name: str) -> bool:
         """Implement ServerReconnector protocol."""
         try:
-            if server_name in self._connection_manager.sessions:
+            if server_name in self._connection_manager.servers:
                 config = self._connection_manager.get_config(server_name)
                 if config:
                     await self.cleanup(server_name)
@@ -440,12 +587,13 @@ class MCPConnectionService(ServerReconnector, ServerCleanupHandler):
 
     def get_session(self, server_name: str) -> ClientSession | None:
         """Get the active session for a server if it exists."""
-        return self._connection_manager.sessions.get(server_name)
+        record = self._connection_manager.servers.get(server_name)
+        return record.session if record else None
 
     @property
     def active_sessions(self) -> dict[str, ClientSession]:
         """Get all active sessions."""
-        return self._connection_manager.sessions.copy()
+        return dict(self._connection_manager.sessions)
 
     async def cleanup_all(self) -> None:
         """Clean up all connections and stop health monitoring.
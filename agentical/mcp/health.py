@@ -9,7 +9,7 @@ from typing import Protocol
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerHealth:
     """Track server connection health."""
 
@@ -88,10 +88,11 @@ class HealthMonitor:
         Args:
             server_name: Name of the server to update
         """
-        if server_name in self.server_health:
-            self.server_health[server_name].last_heartbeat = time.time()
-            self.server_health[server_name].consecutive_failures = 0
-            self.server_health[server_name].is_connected = True
+        health = self.server_health.get(server_name)
+        if health is not None:
+            health.last_heartbeat = time.time()
+            health.consecutive_failures = 0
+            health.is_connected = True
 
     def mark_connection_failed(self, server_name: str, error: str) -> None:
         """Mark a server connection as failed.
@@ -100,8 +101,8 @@ class HealthMonitor:
             server_name: Name of the server that failed
             error: Error message describing the failure
         """
-        if server_name in self.server_health:
-            health = self.server_health[server_name]
+        health = self.server_health.get(server_name)
+        if health is not None:
             health.is_connected = False
             health.last_error = error
             health.consecutive_failures += 1
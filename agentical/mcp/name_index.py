@@ -0,0 +1,98 @@
+"""Name-to-server index shared by the MCP registries.
+
+Several servers may expose a tool, resource or prompt with the same name. The
+registries resolve such a name to the first server that registered it, and
+hand it over to the next server that provides it when that server is removed.
+This module keeps that bookkeeping in one place.
+
+Example:
+    ```python
+    index = ServerNameIndex()
+    index.add("server1", ["search", "fetch"])
+    index.add("server2", ["search"])
+
+    index.get("search")  # "server1"
+    index.remove("server1")
+    index.get("search")  # "server2"
+    ```
+"""
+
+from collections.abc import Iterable
+
+
+class ServerNameIndex:
+    """Maps item names to the server that serves them.
+
+    Note:
+        Lookups are single dict reads. Removing a server costs one scan of
+        the remaining servers per name it owned, which only happens on
+        disconnect.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._names_by_server: dict[str, frozenset[str]] = {}
+        self._name_to_server: dict[str, str] = {}
+
+    def add(self, server_name: str, names: Iterable[str]) -> dict[str, str]:
+        """Record the names a server provides, replacing any earlier entry.
+
+        Args:
+            server_name: Name of the server
+            names: Names of the items the server provides
+
+        Returns:
+            Names that stay resolved to another server, mapped to that server
+        """
+        self.remove(server_name)
+        names = frozenset(names)
+        self._names_by_server[server_name] = names
+
+        shadowed = {}
+        for name in names:
+            owner = self._name_to_server.setdefault(name, server_name)
+            if owner != server_name:
+                shadowed[name] = owner
+        return shadowed
+
+    def remove(self, server_name: str) -> None:
+        """Forget a server, handing its names over to the next provider.
+
+        Args:
+            server_name: Name of the server
+        """
+        for name in self._names_by_server.pop(server_name, frozenset()):
+            if self._name_to_server.get(name) != server_name:
+                continue
+            owner = next(
+                (
+                    other
+                    for other, names in self._names_by_server.items()
+                    if name in names
+                ),
+                None,
+            )
+            if owner is None:
+                del self._name_to_server[name]
+            else:
+                self._name_to_server[name] = owner
+
+    def get(self, name: str) -> str | None:
+        """Get the server a name resolves to.
+
+        Args:
+            name: Name of the item
+
+        Returns:
+            Server name if any server provides the name, None otherwise
+        """
+        return self._name_to_server.get(name)
+
+    def clear(self) -> None:
+        """Remove every server and name."""
+        self._names_by_server.clear()
+        self._name_to_server.clear()
+
+    def __contains__(self, server_name: object) -> bool:
+        """Check whether a server has names recorded in the index."""
+        return server_name in self._names_by_server
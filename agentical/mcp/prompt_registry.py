@@ -20,10 +20,12 @@ Example:
 """
 
 import logging
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Tuple
 
 from mcp.types import Prompt as MCPPrompt
 
+from agentical.mcp.name_index import ServerNameIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,15 +37,32 @@ class PromptRegistry:
 
     Attributes:
         prompts_by_server (Dict[str, List[MCPPrompt]]): Prompts indexed by server
-        all_prompts (List[MCPPrompt]): Combined list of all available prompts
-        _prompt_names (Dict[str, Set[str]]): Prompt names by server for tracking
+        all_prompts (List[MCPPrompt]): Combined list of all available prompts,
+            derived from prompts_by_server and rebuilt lazily after changes
+        _prompt_names (ServerNameIndex): Server hosting each prompt name.
+            When several servers expose the same name, the first registered wins.
     """
 
     def __init__(self):
         """Initialize an empty prompt registry."""
         self.prompts_by_server: Dict[str, List[MCPPrompt]] = {}
-        self.all_prompts: List[MCPPrompt] = []
-        self._prompt_names: Dict[str, Set[str]] = {}
+        self._all_prompts: List[MCPPrompt] | None = []
+        self._prompt_names = ServerNameIndex()
+
+    @property
+    def all_prompts(self) -> List[MCPPrompt]:
+        """Combined list of all available prompts, in registration order."""
+        if self._all_prompts is None:
+            self._all_prompts = [
+                prompt
+                for prompts in self.prompts_by_server.values()
+                for prompt in prompts
+            ]
+        return self._all_prompts
+
+    def _num_prompts(self) -> int:
+        """Count registered prompts without materializing all_prompts."""
+        return sum(len(prompts) for prompts in self.prompts_by_server.values())
 
     def _validate_prompt(self, prompt: MCPPrompt) -> None:
         """Validate a single prompt.
@@ -102,7 +121,7 @@ class PromptRegistry:
 
         Note:
             If the server already has registered prompts, they will be replaced.
-            The all_prompts list is updated to include the new prompts.
+            The all_prompts list is rebuilt on next access to include the new prompts.
             Prompts with the same name can exist on different servers.
         """
         logger.debug(
@@ -120,14 +139,14 @@ class PromptRegistry:
 
             # Update registries
             self.prompts_by_server[server_name] = prompts
-            self.all_prompts.extend(prompts)
-            self._prompt_names[server_name] = {p.name for p in prompts}
+            self._all_prompts = None
+            self._prompt_names.add(server_name, (p.name for p in prompts))
 
             logger.debug(
                 "Prompts registered successfully",
                 extra={
                     "server_name": server_name,
-                    "total_prompts": len(self.all_prompts),
+                    "total_prompts": self._num_prompts(),
                 },
             )
         except (TypeError, ValueError) as e:
@@ -150,34 +169,25 @@ class PromptRegistry:
             Number of prompts removed
 
         Note:
-            This operation updates both prompts_by_server and all_prompts.
+            This operation updates prompts_by_server and invalidates all_prompts.
             If the server doesn't exist, returns 0.
         """
         if server_name not in self.prompts_by_server:
             return 0
 
         try:
-            # Get prompts to remove
-            removed_prompts = self.prompts_by_server[server_name]
-            num_removed = len(removed_prompts)
-
             # Remove from server mapping
-            del self.prompts_by_server[server_name]
-            self._prompt_names.pop(server_name, None)
+            num_removed = len(self.prompts_by_server.pop(server_name))
+            self._prompt_names.remove(server_name)
 
-            # Rebuild all_prompts list
-            self.all_prompts = [
-                prompt
-                for prompts in self.prompts_by_server.values()
-                for prompt in prompts
-            ]
+            self._all_prompts = None
 
             logger.debug(
                 "Server prompts removed",
                 extra={
                     "server_name": server_name,
                     "num_removed": num_removed,
-                    "remaining_prompts": len(self.all_prompts),
+                    "remaining_prompts": self._num_prompts(),
                 },
             )
             return num_removed
@@ -201,17 +211,30 @@ class PromptRegistry:
             Server name if found, None otherwise
 
         Note:
-            If multiple servers have a prompt with the same name,
-            returns the first server found.
+            This is a single dict lookup. If multiple servers have a prompt
+            with the same name, returns the first server that registered it.
         """
         if not prompt_name or not isinstance(prompt_name, str):
             logger.warning("Invalid prompt name", extra={"prompt_name": prompt_name})
             return None
 
-        # Find the server
-        for server_name, names in self._prompt_names.items():
-            if prompt_name in names:
-                return server_name
+        return self._prompt_names.get(prompt_name)
+
+    def get_prompt(self, prompt_name: str) -> MCPPrompt | None:
+        """Get a prompt by name from the server that hosts it.
+
+        Args:
+            prompt_name: Name of the prompt
+
+        Returns:
+            The prompt from the server find_prompt_server returns, None if not found
+        """
+        server_name = self._prompt_names.get(prompt_name)
+        if server_name is None:
+            return None
+        for prompt in self.prompts_by_server[server_name]:
+            if prompt.name == prompt_name:
+                return prompt
         return None
 
     def clear(self) -> Tuple[int, int]:
@@ -225,7 +248,7 @@ class PromptRegistry:
             Both prompts_by_server and all_prompts collections are cleared.
         """
         try:
-            num_prompts = len(self.all_prompts)
+            num_prompts = self._num_prompts()
             num_servers = len(self.prompts_by_server)
 
             logger.debug(
@@ -234,7 +257,7 @@ class PromptRegistry:
             )
 
             self.prompts_by_server.clear()
-            self.all_prompts.clear()
+            self._all_prompts = []
             self._prompt_names.clear()
 
             return num_prompts, num_servers
@@ -49,17 +49,22 @@ Implementation Notes:
     - Ensures proper resource cleanup
 """
 
+import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from contextlib import AsyncExitStack
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, NoReturn
 
 from mcp.types import CallToolResult, Resource as MCPResource, Prompt as MCPPrompt
 
-from agentical.api import LLMBackend
+from agentical.api import NO_RESPONSE, LLMBackend
 from agentical.mcp.config import DictBasedMCPConfigProvider, MCPConfigProvider
 from agentical.mcp.connection import MCPConnectionService
+from agentical.mcp.response_cache import QueryResponseCache
 from agentical.mcp.schemas import ServerConfig
+from agentical.mcp.tool_cache import ToolResultCache, is_cacheable_tool
 from agentical.mcp.tool_registry import ToolRegistry
 from agentical.mcp.resource_registry import ResourceRegistry
 from agentical.mcp.prompt_registry import PromptRegistry
@@ -68,6 +73,41 @@ from agentical.utils.log_utils import sanitize_log_message
 logger = logging.getLogger(__name__)
 
 
+async def _list_all_pages(
+    list_method: Callable[..., Awaitable[Any]], field: str
+) -> list[Any]:
+    """Collect every page of a paginated MCP list request.
+
+    Args:
+        list_method: Session method such as ``session.list_tools``
+        field: Result attribute holding the page items, e.g. ``"tools"``
+
+    Returns:
+        Items from all pages, in server order
+    """
+    result = await list_method()
+    items = list(getattr(result, field))
+    cursor = getattr(result, "nextCursor", None)
+    while isinstance(cursor, str) and cursor:
+        result = await list_method(cursor)
+        items.extend(getattr(result, field))
+        cursor = getattr(result, "nextCursor", None)
+    return items
+
+
+@dataclass(slots=True)
+class _ServerDiscovery:
+    """Listing results of a connected server awaiting registration.
+
+    Each list holds the exception instead if that listing failed.
+    """
+
+    start_time: float
+    tools: list[Any] | BaseException
+    resources: list[Any] | BaseException
+    prompts: list[Any] | BaseException
+
+
 class MCPToolProvider:
     """Main facade for integrating LLMs with MCP tools, resources, and prompts."""
 
@@ -76,9 +116,32 @@ class MCPToolProvider:
         llm_backend: LLMBackend,
         config_provider: MCPConfigProvider | None = None,
         server_configs: dict[str, ServerConfig] | None = None,
+        concurrent_startup: bool = True,
+        tool_cache_size: int = 0,
+        max_concurrent_connects: int = 8,
+        response_cache_size: int = 0,
     ):
-        """Initialize the MCP Tool Provider."""
-        start_time = time.time()
+        """Initialize the MCP Tool Provider.
+
+        Args:
+            llm_backend: Backend used to process queries
+            config_provider: Source of server configurations
+            server_configs: Server configurations, used instead of config_provider
+            concurrent_startup: Connect to all servers concurrently in
+                mcp_connect_all. Set to False to connect one at a time.
+            tool_cache_size: Number of read-only tool results to cache. Only
+                tools the server annotates with readOnlyHint are cached.
+                Caching is disabled when 0.
+            max_concurrent_connects: Maximum number of servers mcp_connect_all
+                starts at once when concurrent_startup is enabled
+            response_cache_size: Number of query responses to cache. A repeated
+                query with the same tools is answered without calling the LLM
+                or any tools. Only answers that called no tools, or only tools
+                annotated read-only, are cached, and read-only results can
+                still go stale while an answer is cached. Caching is disabled
+                when 0.
+        """
+        start_time = time.monotonic()
         logger.info(
             "Initializing MCPToolProvider",
             extra={
@@ -104,6 +167,9 @@ class MCPToolProvider:
                 "Either config_provider or server_configs must be provided"
             )
 
+        if max_concurrent_connects < 1:
+            raise ValueError("max_concurrent_connects must be at least 1")
+
         self.exit_stack = AsyncExitStack()
         self.connection_service = MCPConnectionService(self.exit_stack)
         self.available_servers: dict[str, ServerConfig] = {}
@@ -112,25 +178,31 @@ class MCPToolProvider:
         self.resource_registry = ResourceRegistry()
         self.prompt_registry = PromptRegistry()
         self._connected_servers: Dict[str, bool] = {}
+        self.concurrent_startup = concurrent_startup
+        self.max_concurrent_connects = max_concurrent_connects
+        self.tool_cache = ToolResultCache(tool_cache_size) if tool_cache_size else None
+        self.response_cache = (
+            QueryResponseCache(response_cache_size) if response_cache_size else None
+        )
 
         # Store configuration source
         self.config_provider = config_provider
         if server_configs:
             self.config_provider = DictBasedMCPConfigProvider(server_configs)
 
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.info(
             "MCPToolProvider initialized", extra={"duration_ms": int(duration * 1000)}
         )
 
     async def initialize(self) -> None:
         """Initialize the provider with configurations."""
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Loading provider configurations")
 
         try:
             self.available_servers = await self.config_provider.load_config()
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 "Provider configurations loaded",
                 extra={
@@ -140,7 +212,7 @@ class MCPToolProvider:
                 },
             )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Failed to load configurations",
                 extra={
@@ -161,14 +233,33 @@ class MCPToolProvider:
 
     async def mcp_connect(self, server_name: str) -> None:
         """Connect to a specific MCP server by name."""
-        start_time = time.time()
+        discovery = await self._discover_server(server_name)
+        await self._register_server(server_name, discovery)
+
+    async def _discover_server(self, server_name: str) -> _ServerDiscovery:
+        """Connect to a server and list its tools, resources and prompts.
+
+        Args:
+            server_name: Name of the configured server
+
+        Returns:
+            The listing results, not yet registered
+
+        Raises:
+            ValueError: If the server name is invalid or unknown
+            ConnectionError: If the connection fails
+        """
+        start_time = time.monotonic()
         logger.info("Connecting to server", extra={"server_name": server_name})
 
         if not isinstance(server_name, str) or not server_name.strip():
             logger.error("Invalid server name", extra={"server_name": server_name})
             raise ValueError("server_name must be a non-empty string")
 
-        if server_name not in self.available_servers:
+        # Configs are validated ServerConfig models from load time, so no
+        # per-connect field checks are needed here
+        config = self.available_servers.get(server_name)
+        if config is None:
             logger.error(
                 "Unknown server",
                 extra={
@@ -183,60 +274,80 @@ class MCPToolProvider:
 
         try:
             # Connect using connection service with config
-            session = await self.connection_service.connect(
-                server_name, self.available_servers[server_name]
+            session = await self.connection_service.connect(server_name, config)
+
+            # Discover tools, resources and prompts concurrently
+            tools, resources, prompts = await asyncio.gather(
+                _list_all_pages(session.list_tools, "tools"),
+                _list_all_pages(session.list_resources, "resources"),
+                _list_all_pages(session.list_prompts, "prompts"),
+                return_exceptions=True,
             )
+        except Exception as e:
+            await self._connect_failed(server_name, e, start_time)
+
+        return _ServerDiscovery(start_time, tools, resources, prompts)
 
-            # Initialize and get tools
-            response = await session.list_tools()
-            self.tool_registry.register_server_tools(server_name, response.tools)
+    async def _register_server(
+        self, server_name: str, discovery: _ServerDiscovery
+    ) -> None:
+        """Register what was discovered on a connected server.
 
-            # Get and register resources if available
+        Args:
+            server_name: Name of the server
+            discovery: Listing results from ``_discover_server``
+
+        Raises:
+            ConnectionError: If the server's tools could not be listed
+        """
+        tools = discovery.tools
+        resources = discovery.resources
+        prompts = discovery.prompts
+        try:
+            if isinstance(tools, BaseException):
+                raise tools
+            self.tool_registry.register_server_tools(server_name, tools)
+
+            # Register resources if available
             try:
-                resources = await session.list_resources()
-                if resources and resources.resources:
+                if isinstance(resources, BaseException):
+                    raise resources
+                if resources:
                     self.resource_registry.register_server_resources(
-                        server_name, resources.resources
-                    )
-                    # Verify resources were registered
-                    registered_resources = self.resource_registry.get_server_resources(
-                        server_name
-                    )
-                    logger.debug(
-                        "Server resources registered",
-                        extra={
-                            "server_name": server_name,
-                            "num_resources": len(registered_resources),
-                            "resource_names": [r.name for r in registered_resources],
-                        },
+                        server_name, resources
                     )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Server resources registered",
+                            extra={
+                                "server_name": server_name,
+                                "num_resources": len(resources),
+                                "resource_names": [r.name for r in resources],
+                            },
+                        )
             except Exception as e:
                 logger.debug(f"Server does not support resources: {e}")
 
-            # Get and register prompts if available
+            # Register prompts if available
             try:
-                prompts = await session.list_prompts()
-                if prompts and prompts.prompts:
-                    self.prompt_registry.register_server_prompts(
-                        server_name, prompts.prompts
-                    )
-                    # Verify prompts were registered
-                    registered_prompts = self.prompt_registry.get_server_prompts(
-                        server_name
-                    )
-                    logger.debug(
-                        "Server prompts registered",
-                        extra={
-                            "server_name": server_name,
-                            "num_prompts": len(registered_prompts),
-                            "prompt_names": [p.name for p in registered_prompts],
-                        },
-                    )
+                if isinstance(prompts, BaseException):
+                    raise prompts
+                if prompts:
+                    self.prompt_registry.register_server_prompts(server_name, prompts)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Server prompts registered",
+                            extra={
+                                "server_name": server_name,
+                                "num_prompts": len(prompts),
+                                "prompt_names": [p.name for p in prompts],
+                            },
+                        )
             except Exception as e:
                 logger.debug(f"Server does not support prompts: {e}")
 
-            tool_names = [tool.name for tool in response.tools]
-            duration = time.time() - start_time
+            tool_names = [tool.name for tool in tools]
+            duration = time.monotonic() - discovery.start_time
             logger.info(
                 "Server connection successful",
                 extra={
@@ -248,21 +359,41 @@ class MCPToolProvider:
             )
 
         except Exception as e:
-            duration = time.time() - start_time
-            logger.error(
-                "Server connection failed",
-                extra={
-                    "server_name": server_name,
-                    "error": sanitize_log_message(str(e)),
-                    "duration_ms": int(duration * 1000),
-                },
-            )
-            await self.cleanup_server(server_name)
-            raise ConnectionError(f"Failed to connect to server '{server_name}': {e!s}")
+            await self._connect_failed(server_name, e, discovery.start_time)
+
+    async def _connect_failed(
+        self, server_name: str, error: Exception, start_time: float
+    ) -> NoReturn:
+        """Log a failed connection, release the server and raise.
+
+        Args:
+            server_name: Name of the server
+            error: The failure
+            start_time: ``time.monotonic()`` when the connection started
+
+        Raises:
+            ConnectionError: Always, wrapping ``error``
+        """
+        duration = time.monotonic() - start_time
+        logger.error(
+            "Server connection failed",
+            extra={
+                "server_name": server_name,
+                "error": sanitize_log_message(str(error)),
+                "duration_ms": int(duration * 1000),
+            },
+        )
+        await self.cleanup_server(server_name)
+        raise ConnectionError(f"Failed to connect to server '{server_name}': {error!s}")
 
     async def mcp_connect_all(self) -> list[tuple[str, Exception | None]]:
-        """Connect to all available MCP servers concurrently."""
-        start_time = time.time()
+        """Connect to all available MCP servers concurrently.
+
+        Servers are connected and listed concurrently, but registered in
+        configuration order, so a name offered by several servers always
+        resolves to the first configured one.
+        """
+        start_time = time.monotonic()
         servers = self.list_available_servers()
         logger.info(
             "Connecting to all servers",
@@ -273,47 +404,75 @@ class MCPToolProvider:
             logger.warning("No servers available")
             return []
 
+        # Each server's transport is owned by its own task in the connection
+        # manager, so connecting from concurrent tasks is safe. The semaphore
+        # keeps large configurations from spawning every server at once.
+        if self.concurrent_startup:
+            semaphore = asyncio.Semaphore(self.max_concurrent_connects)
+            discoveries = await asyncio.gather(
+                *(self._discover_one(server_name, semaphore) for server_name in servers)
+            )
+        else:
+            discoveries = [
+                await self._discover_one(server_name) for server_name in servers
+            ]
+
         results = []
-        # Connect to each server sequentially to avoid task/context issues
-        for server_name in servers:
+        for server_name, discovery in zip(servers, discoveries):
+            if isinstance(discovery, Exception):
+                results.append((server_name, discovery))
+                continue
             try:
-                await self.mcp_connect(server_name)
+                await self._register_server(server_name, discovery)
                 results.append((server_name, None))
-                logger.info(
-                    "Server connection successful", extra={"server_name": server_name}
-                )
             except Exception as e:
-                results.append((server_name, e))
-                logger.error(
-                    "Server connection failed",
-                    extra={
-                        "server_name": server_name,
-                        "error": sanitize_log_message(str(e)),
-                    },
+                logger.debug(
+                    "Server connection failed", extra={"server_name": server_name}
                 )
+                results.append((server_name, e))
 
-        duration = time.time() - start_time
-        successful = sum(1 for _, e in results if e is None)
-        failed = sum(1 for _, e in results if e is not None)
+        duration = time.monotonic() - start_time
+        failed_servers = [name for name, e in results if e is not None]
         logger.info(
             "All server connections completed",
             extra={
-                "successful_connections": successful,
-                "failed_connections": failed,
+                "successful_connections": len(results) - len(failed_servers),
+                "failed_connections": len(failed_servers),
+                "failed_servers": failed_servers,
                 "duration_ms": int(duration * 1000),
             },
         )
         return results
 
+    async def _discover_one(
+        self, server_name: str, semaphore: asyncio.Semaphore | None = None
+    ) -> _ServerDiscovery | Exception:
+        """Discover a server, returning the failure instead of raising it."""
+        # _discover_server already logs the outcome of each connection
+        try:
+            if semaphore is None:
+                return await self._discover_server(server_name)
+            async with semaphore:
+                return await self._discover_server(server_name)
+        except Exception as e:
+            logger.debug("Server connection failed", extra={"server_name": server_name})
+            return e
+
     async def cleanup_server(self, server_name: str) -> None:
         """Clean up resources for a specific server."""
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Cleaning up server", extra={"server_name": server_name})
 
         try:
             # Clean up connection
             await self.connection_service.cleanup(server_name)
 
+            # Cached results may have come from this server
+            if self.tool_cache is not None:
+                self.tool_cache.clear()
+            if self.response_cache is not None:
+                self.response_cache.clear()
+
             # Remove tools
             self.tool_registry.remove_server_tools(server_name)
 
@@ -323,13 +482,13 @@ class MCPToolProvider:
             # Remove prompts
             self.prompt_registry.remove_server_prompts(server_name)
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 "Server cleanup successful",
                 extra={"server_name": server_name, "duration_ms": int(duration * 1000)},
             )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Server cleanup failed",
                 extra={
@@ -342,7 +501,7 @@ class MCPToolProvider:
 
     async def reconnect(self, server_name: str) -> bool:
         """Attempt to reconnect to a server."""
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Reconnecting to server", extra={"server_name": server_name})
 
         try:
@@ -352,14 +511,14 @@ class MCPToolProvider:
             # Try to reconnect
             await self.mcp_connect(server_name)
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 "Server reconnection successful",
                 extra={"server_name": server_name, "duration_ms": int(duration * 1000)},
             )
             return True
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Server reconnection failed",
                 extra={
@@ -372,7 +531,7 @@ class MCPToolProvider:
 
     async def get_resource(self, resource_name: str) -> MCPResource:
         """Get a resource by name."""
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Getting resource", extra={"resource_name": resource_name})
 
         try:
@@ -386,7 +545,7 @@ class MCPToolProvider:
             if not resource:
                 raise ValueError(f"Resource not found: {resource_name}")
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 "Resource retrieved successfully",
                 extra={
@@ -397,7 +556,7 @@ class MCPToolProvider:
             )
             return resource
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Failed to get resource",
                 extra={
@@ -410,7 +569,7 @@ class MCPToolProvider:
 
     async def get_prompt(self, prompt_name: str) -> MCPPrompt:
         """Get a prompt by name."""
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Getting prompt", extra={"prompt_name": prompt_name})
 
         try:
@@ -424,7 +583,7 @@ class MCPToolProvider:
             if not prompt:
                 raise ValueError(f"Prompt not found: {prompt_name}")
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 "Prompt retrieved successfully",
                 extra={
@@ -435,7 +594,7 @@ class MCPToolProvider:
             )
             return prompt
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Failed to get prompt",
                 extra={
@@ -458,7 +617,7 @@ class MCPToolProvider:
             - Ensures proper task cancellation
             - Closes all resources in correct order
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Starting provider cleanup")
 
         try:
@@ -518,15 +677,19 @@ class MCPToolProvider:
 
             # Clear connection tracking
             self._connected_servers.clear()
+            if self.tool_cache is not None:
+                self.tool_cache.clear()
+            if self.response_cache is not None:
+                self.response_cache.clear()
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(
                 "Provider cleanup completed",
                 extra={"duration_ms": int(duration * 1000)},
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Provider cleanup failed",
                 extra={
@@ -552,15 +715,18 @@ class MCPToolProvider:
             ValueError: If tool is not found or server is not connected
             Exception: If tool execution fails
         """
-        tool_start = time.time()
-        logger.debug(
-            "Executing tool", extra={"tool_name": tool_name, "tool_args": tool_args}
-        )
+        tool_start = time.monotonic()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                "Executing tool",
+                extra={"tool_name": tool_name, "tool_args": tool_args},
+            )
 
         # Find which server has this tool
         server_name = self.tool_registry.find_tool_server(tool_name)
         if not server_name:
-            tool_duration = time.time() - tool_start
+            tool_duration = time.monotonic() - tool_start
             logger.error(
                 "Tool not found",
                 extra={
@@ -570,28 +736,47 @@ class MCPToolProvider:
             )
             raise ValueError(f"Tool {tool_name} not found in any connected server")
 
-        logger.debug(
-            "Found tool in server",
-            extra={"tool_name": tool_name, "server_name": server_name},
-        )
+        if debug_enabled:
+            logger.debug(
+                "Found tool in server",
+                extra={"tool_name": tool_name, "server_name": server_name},
+            )
+        cache = self.tool_cache
+        if cache is not None and not is_cacheable_tool(
+            self.tool_registry.get_tool(tool_name)
+        ):
+            cache = None
+        if cache is not None:
+            result = cache.get(tool_name, tool_args)
+            if result is not None:
+                if debug_enabled:
+                    logger.debug(
+                        "Tool result served from cache",
+                        extra={"tool_name": tool_name, "server_name": server_name},
+                    )
+                return result
+
         try:
             session = self.connection_service.get_session(server_name)
             if not session:
                 raise ValueError(f"No active session for server {server_name}")
 
             result = await session.call_tool(tool_name, tool_args)
-            tool_duration = time.time() - tool_start
-            logger.debug(
-                "Tool execution successful",
-                extra={
-                    "tool_name": tool_name,
-                    "server_name": server_name,
-                    "duration_ms": int(tool_duration * 1000),
-                },
-            )
+            if cache is not None and not result.isError:
+                cache.put(tool_name, tool_args, result)
+            if debug_enabled:
+                tool_duration = time.monotonic() - tool_start
+                logger.debug(
+                    "Tool execution successful",
+                    extra={
+                        "tool_name": tool_name,
+                        "server_name": server_name,
+                        "duration_ms": int(tool_duration * 1000),
+                    },
+                )
             return result
         except Exception as e:
-            tool_duration = time.time() - tool_start
+            tool_duration = time.monotonic() - tool_start
             logger.error(
                 "Tool execution failed",
                 extra={
@@ -615,35 +800,75 @@ class MCPToolProvider:
         Raises:
             Exception: If query processing fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info("Processing query", extra={"query": query})
 
+        tools = self.tool_registry.tools_view()
+        if self.response_cache is not None:
+            tool_names = [tool.name for tool in tools]
+            cached = self.response_cache.get(query, tool_names)
+            if cached is not None:
+                logger.info(
+                    "Query answered from response cache",
+                    extra={"duration_ms": int((time.monotonic() - start_time) * 1000)},
+                )
+                return cached
+
         try:
             # Process the query using all available tools, resources, and prompts
-            logger.debug(
-                "Sending query to LLM backend",
-                extra={
-                    "num_tools": len(self.tool_registry.all_tools),
-                    "num_resources": len(self.resource_registry.all_resources),
-                    "num_prompts": len(self.prompt_registry.all_prompts),
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sending query to LLM backend",
+                    extra={
+                        "num_tools": len(self.tool_registry.all_tools),
+                        "num_resources": len(self.resource_registry.all_resources),
+                        "num_prompts": len(self.prompt_registry.all_prompts),
+                    },
+                )
+            execute_tool = self.execute_tool
+            uncacheable = False
+            if self.response_cache is not None:
+
+                async def execute_tool(
+                    tool_name: str, tool_args: dict[str, Any]
+                ) -> CallToolResult:
+                    # Answers built on tools that may change state, return
+                    # live data or failed must not be replayed from the cache
+                    nonlocal uncacheable
+                    if not is_cacheable_tool(self.tool_registry.get_tool(tool_name)):
+                        uncacheable = True
+                    try:
+                        result = await self.execute_tool(tool_name, tool_args)
+                    except Exception:
+                        uncacheable = True
+                        raise
+                    if result.isError:
+                        uncacheable = True
+                    return result
+
             response = await self.llm_backend.process_query(
                 query=query,
-                tools=self.tool_registry.all_tools,
+                tools=tools,
                 resources=self.resource_registry.all_resources,
                 prompts=self.prompt_registry.all_prompts,
-                execute_tool=self.execute_tool,
+                execute_tool=execute_tool,
                 context=None,
             )
-            duration = time.time() - start_time
+            if (
+                self.response_cache is not None
+                and response
+                and response != NO_RESPONSE
+                and not uncacheable
+            ):
+                self.response_cache.put(query, tool_names, response)
+            duration = time.monotonic() - start_time
             logger.info(
                 "Query processing completed",
                 extra={"duration_ms": int(duration * 1000)},
             )
             return response
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(
                 "Query processing failed",
                 extra={
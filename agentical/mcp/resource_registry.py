@@ -20,10 +20,12 @@ Example:
 """
 
 import logging
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Tuple
 
 from mcp.types import Resource as MCPResource
 
+from agentical.mcp.name_index import ServerNameIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,15 +37,32 @@ class ResourceRegistry:
 
     Attributes:
         resources_by_server (Dict[str, List[MCPResource]]): Resources indexed by server
-        all_resources (List[MCPResource]): Combined list of all available resources
-        _resource_names (Dict[str, Set[str]]): Resource names by server for tracking
+        all_resources (List[MCPResource]): Combined list of all available resources,
+            derived from resources_by_server and rebuilt lazily after changes
+        _resource_names (ServerNameIndex): Server hosting each resource name.
+            When several servers expose the same name, the first registered wins.
     """
 
     def __init__(self):
         """Initialize an empty resource registry."""
         self.resources_by_server: Dict[str, List[MCPResource]] = {}
-        self.all_resources: List[MCPResource] = []
-        self._resource_names: Dict[str, Set[str]] = {}
+        self._all_resources: List[MCPResource] | None = []
+        self._resource_names = ServerNameIndex()
+
+    @property
+    def all_resources(self) -> List[MCPResource]:
+        """Combined list of all available resources, in registration order."""
+        if self._all_resources is None:
+            self._all_resources = [
+                resource
+                for resources in self.resources_by_server.values()
+                for resource in resources
+            ]
+        return self._all_resources
+
+    def _num_resources(self) -> int:
+        """Count registered resources without materializing all_resources."""
+        return sum(len(resources) for resources in self.resources_by_server.values())
 
     def _validate_resource(self, resource: MCPResource) -> None:
         """Validate a single resource.
@@ -106,7 +125,7 @@ class ResourceRegistry:
 
         Note:
             If the server already has registered resources, they will be replaced.
-            The all_resources list is updated to include the new resources.
+            The all_resources list is rebuilt on next access to include the new resources.
             Resources with the same name can exist on different servers.
         """
         logger.debug(
@@ -124,14 +143,14 @@ class ResourceRegistry:
 
             # Update registries
             self.resources_by_server[server_name] = resources
-            self.all_resources.extend(resources)
-            self._resource_names[server_name] = {r.name for r in resources}
+            self._all_resources = None
+            self._resource_names.add(server_name, (r.name for r in resources))
 
             logger.debug(
                 "Resources registered successfully",
                 extra={
                     "server_name": server_name,
-                    "total_resources": len(self.all_resources),
+                    "total_resources": self._num_resources(),
                 },
             )
         except (TypeError, ValueError) as e:
@@ -154,34 +173,25 @@ class ResourceRegistry:
             Number of resources removed
 
         Note:
-            This operation updates both resources_by_server and all_resources.
+            This operation updates resources_by_server and invalidates all_resources.
             If the server doesn't exist, returns 0.
         """
         if server_name not in self.resources_by_server:
             return 0
 
         try:
-            # Get resources to remove
-            removed_resources = self.resources_by_server[server_name]
-            num_removed = len(removed_resources)
-
             # Remove from server mapping
-            del self.resources_by_server[server_name]
-            self._resource_names.pop(server_name, None)
+            num_removed = len(self.resources_by_server.pop(server_name))
+            self._resource_names.remove(server_name)
 
-            # Rebuild all_resources list
-            self.all_resources = [
-                resource
-                for resources in self.resources_by_server.values()
-                for resource in resources
-            ]
+            self._all_resources = None
 
             logger.debug(
                 "Server resources removed",
                 extra={
                     "server_name": server_name,
                     "num_removed": num_removed,
-                    "remaining_resources": len(self.all_resources),
+                    "remaining_resources": self._num_resources(),
                 },
             )
             return num_removed
@@ -214,10 +224,24 @@ class ResourceRegistry:
             )
             return None
 
-        # Find the server
-        for server_name, names in self._resource_names.items():
-            if resource_name in names:
-                return server_name
+        return self._resource_names.get(resource_name)
+
+    def get_resource(self, resource_name: str) -> MCPResource | None:
+        """Get a resource by name from the server that hosts it.
+
+        Args:
+            resource_name: Name of the resource
+
+        Returns:
+            The resource from the server find_resource_server returns, None if
+            not found
+        """
+        server_name = self._resource_names.get(resource_name)
+        if server_name is None:
+            return None
+        for resource in self.resources_by_server[server_name]:
+            if resource.name == resource_name:
+                return resource
         return None
 
     def clear(self) -> Tuple[int, int]:
@@ -231,7 +255,7 @@ class ResourceRegistry:
             Both resources_by_server and all_resources collections are cleared.
         """
         try:
-            num_resources = len(self.all_resources)
+            num_resources = self._num_resources()
             num_servers = len(self.resources_by_server)
 
             logger.debug(
@@ -240,7 +264,7 @@ class ResourceRegistry:
             )
 
             self.resources_by_server.clear()
-            self.all_resources.clear()
+            self._all_resources = []
             self._resource_names.clear()
 
             return num_resources, num_servers
@@ -0,0 +1,44 @@
+"""Response cache for repeated queries.
+
+Answering a query takes at least one LLM round trip, and usually several when
+tools are involved. When the same query is asked again against the same set of
+tools, the provider can return the earlier answer from this cache instead.
+
+Example:
+    ```python
+    cache = QueryResponseCache(maxsize=64)
+
+    response = cache.get(query, tool_names)
+    if response is None:
+        response = await llm_backend.process_query(...)
+        cache.put(query, tool_names, response)
+    ```
+
+Implementation Notes:
+    - Only exact matches are served; queries are compared after stripping
+      surrounding whitespace
+    - Entries are evicted least recently used first
+    - A cached answer skips the tool calls that produced it, so the provider
+      only caches answers whose tool calls, if any, were read-only and
+      succeeded; even those can go stale while cached
+"""
+
+from collections.abc import Iterable
+
+from agentical.utils.lru_cache import BoundedLRUCache
+
+
+class QueryResponseCache(BoundedLRUCache[str]):
+    """Bounded LRU cache of responses keyed by query and available tools.
+
+    ``get(query, tool_names)`` returns the cached response or None, and
+    ``put(query, tool_names, response)`` stores one.
+
+    Attributes:
+        maxsize (int): Maximum number of responses kept
+    """
+
+    @staticmethod
+    def _key(query: str, tool_names: Iterable[str]) -> tuple[str, tuple[str, ...]]:
+        """Build the cache key for a query."""
+        return query.strip(), tuple(sorted(tool_names))
@@ -1,7 +1,5 @@
 """Configuration schemas for MCP provider."""
 
-from typing import Any
-
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -15,8 +13,17 @@ class ServerConfig(BaseModel):
     env: dict[str, str] | None = Field(
         None, description="Environment variables for the server"
     )
+    timeout_seconds: float | None = Field(
+        None,
+        gt=0,
+        description=(
+            "Maximum seconds to wait for the response to each request sent to "
+            "the server; waits indefinitely when unset"
+        ),
+    )
 
     @field_validator("command")
+    @classmethod
     def command_not_empty(cls, v: str) -> str:
         """Validate that command is not empty."""
         if not v.strip():
@@ -24,9 +31,11 @@ class ServerConfig(BaseModel):
         return v
 
     @field_validator("args")
-    def validate_args(cls, v: list[str], values: dict[str, Any]) -> list[str]:
+    @classmethod
+    def validate_args(cls, v: list[str]) -> list[str]:
         """Validate args list contains valid strings when present."""
-        if v and any(not isinstance(arg, str) or not arg.strip() for arg in v):
+        # Item types are already enforced by the list[str] annotation
+        if any(not arg.strip() for arg in v):
             raise ValueError("All args must be non-empty strings")
         return v
 
@@ -39,6 +48,7 @@ class MCPConfig(BaseModel):
     )
 
     @field_validator("servers")
+    @classmethod
     def servers_not_empty(cls, v: dict[str, ServerConfig]) -> dict[str, ServerConfig]:
         """Validate that servers dictionary is not empty."""
         if not v:
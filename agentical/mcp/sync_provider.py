@@ -0,0 +1,218 @@
+"""Synchronous facade over MCPToolProvider.
+
+This module lets synchronous code (scripts, notebooks, WSGI handlers) use an
+MCPToolProvider without calling ``asyncio.run`` for every operation. Each
+``asyncio.run`` call creates and tears down an event loop, which would also
+tear down every server session the provider holds.
+
+Instead, one background thread runs a long-lived event loop that owns the
+provider and its sessions. Synchronous callers, from any number of threads,
+submit coroutines to that loop and block on the result.
+
+Example:
+    ```python
+    from agentical.mcp import MCPClientWrapper, MCPToolProvider
+    from agentical.mcp.config import FileBasedMCPConfigProvider
+
+    provider = MCPToolProvider(
+        llm_backend, config_provider=FileBasedMCPConfigProvider("config.json")
+    )
+    with MCPClientWrapper(provider) as client:
+        client.initialize()
+        client.mcp_connect_all()
+        print(client.process_query("What files are in the current directory?"))
+    ```
+
+Implementation Notes:
+    - The loop thread is a daemon thread so it never blocks interpreter exit
+    - Calls are dispatched with asyncio.run_coroutine_threadsafe
+    - Calls from several threads run concurrently on the shared loop
+    - The loop is a uvloop loop when the optional ``uvloop`` extra is installed
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from mcp.types import CallToolResult
+
+from agentical.mcp.provider import MCPToolProvider
+
+T = TypeVar("T")
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when it is installed.
+
+    Server sessions are bound by pipe I/O, which uvloop handles with less
+    per-callback overhead than the standard selector loop.
+
+    Returns:
+        A new uvloop loop if uvloop is importable, otherwise a standard one
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+class AsyncLoopThread:
+    """Runs an asyncio event loop forever in a background daemon thread.
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): The event loop owned by the thread
+    """
+
+    def __init__(self, name: str = "agentical-event-loop"):
+        """Start the event loop thread.
+
+        Args:
+            name: Name of the background thread
+        """
+        self.loop = new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Thread target: run the loop until stopped, then close it."""
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread is still alive."""
+        return self._thread.is_alive()
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the loop thread itself, or if the loop
+                thread has been stopped
+            concurrent.futures.TimeoutError: If the result is not available
+                within timeout
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block on the event loop from its own thread")
+        if not self.is_running:
+            coro.close()
+            raise RuntimeError("Event loop thread is not running")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the loop and wait for the thread to finish.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to exit
+        """
+        if self.is_running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+
+
+class MCPClientWrapper:
+    """Blocking interface to an MCPToolProvider running on a loop thread.
+
+    All methods block the calling thread until the corresponding provider
+    coroutine completes on the shared event loop. They accept an optional
+    ``timeout`` in seconds, defaulting to the wrapper's ``timeout``.
+
+    Attributes:
+        provider (MCPToolProvider): The wrapped provider
+        timeout (float | None): Default timeout for blocking calls
+    """
+
+    def __init__(
+        self,
+        provider: MCPToolProvider,
+        timeout: float | None = None,
+        loop_thread: AsyncLoopThread | None = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            provider: Provider to drive. Its sessions live on the loop thread.
+            timeout: Default timeout in seconds for blocking calls
+            loop_thread: Existing loop thread to share; a new one is started
+                and owned by the wrapper when omitted
+        """
+        self.provider = provider
+        self.timeout = timeout
+        self._owns_loop = loop_thread is None
+        self._loop_thread = loop_thread or AsyncLoopThread()
+
+    def _run(self, coro: Coroutine[Any, Any, T], timeout: float | None) -> T:
+        """Run a provider coroutine using the call or default timeout."""
+        return self._loop_thread.run(coro, self.timeout if timeout is None else timeout)
+
+    def initialize(self, timeout: float | None = None) -> None:
+        """Load the provider configuration."""
+        self._run(self.provider.initialize(), timeout)
+
+    def mcp_connect(self, server_name: str, timeout: float | None = None) -> None:
+        """Connect to a specific MCP server by name."""
+        self._run(self.provider.mcp_connect(server_name), timeout)
+
+    def mcp_connect_all(
+        self, timeout: float | None = None
+    ) -> list[tuple[str, Exception | None]]:
+        """Connect to all available MCP servers."""
+        return self._run(self.provider.mcp_connect_all(), timeout)
+
+    def execute_tool(
+        self,
+        tool_name: str,
+        tool_args: dict[str, Any],
+        timeout: float | None = None,
+    ) -> CallToolResult:
+        """Execute a tool by name with the given arguments."""
+        return self._run(self.provider.execute_tool(tool_name, tool_args), timeout)
+
+    def process_query(self, query: str, timeout: float | None = None) -> str:
+        """Process a query using the LLM backend and available tools."""
+        return self._run(self.provider.process_query(query), timeout)
+
+    def cleanup_all(self, timeout: float | None = None) -> None:
+        """Clean up all provider resources."""
+        self._run(self.provider.cleanup_all(), timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Clean up the provider and stop the loop thread if the wrapper owns it.
+
+        Args:
+            timeout: Maximum seconds to wait for cleanup
+        """
+        try:
+            if self._loop_thread.is_running:
+                self.cleanup_all(timeout)
+        finally:
+            if self._owns_loop:
+                self._loop_thread.stop(timeout)
+
+    def __enter__(self) -> "MCPClientWrapper":
+        """Return the wrapper for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Clean up on leaving a with statement."""
+        self.close()
@@ -0,0 +1,61 @@
+"""Result cache for read-only MCP tool calls.
+
+Agents often repeat the same search or fetch within one conversation. When a
+server marks a tool as read-only, repeating the call with the same arguments
+returns the same data, so the provider can answer from this cache instead of
+another round trip to the server.
+
+Example:
+    ```python
+    cache = ToolResultCache(maxsize=128)
+
+    result = cache.get("search", {"query": "mcp"})
+    if result is None:
+        result = await session.call_tool("search", {"query": "mcp"})
+        cache.put("search", {"query": "mcp"}, result)
+    ```
+
+Implementation Notes:
+    - Entries are evicted least recently used first
+    - Arguments are canonicalized with sorted keys, so key order does not matter
+    - Only tools annotated with ``readOnlyHint=True`` are considered cacheable
+"""
+
+import json
+from typing import Any
+
+from mcp.types import CallToolResult, Tool as MCPTool
+
+from agentical.utils.lru_cache import BoundedLRUCache
+
+
+def is_cacheable_tool(tool: MCPTool | None) -> bool:
+    """Check whether a tool's results may be served from the cache.
+
+    Args:
+        tool: The tool to check
+
+    Returns:
+        True only if the server annotated the tool as read-only
+
+    Note:
+        Tools without annotations are treated as possibly mutating.
+    """
+    annotations = getattr(tool, "annotations", None)
+    return annotations is not None and annotations.readOnlyHint is True
+
+
+class ToolResultCache(BoundedLRUCache[CallToolResult]):
+    """Bounded LRU cache of tool results keyed by tool name and arguments.
+
+    ``get(tool_name, tool_args)`` returns the cached result or None, and
+    ``put(tool_name, tool_args, result)`` stores one.
+
+    Attributes:
+        maxsize (int): Maximum number of results kept
+    """
+
+    @staticmethod
+    def _key(tool_name: str, tool_args: dict[str, Any]) -> tuple[str, str]:
+        """Build the cache key for a call."""
+        return tool_name, json.dumps(tool_args, sort_keys=True, default=str)
@@ -14,18 +14,59 @@ Example:
     # Find which server hosts a tool
     server = registry.find_tool_server("tool_name")
 
+    # Get a snapshot of all registered tools
+    tools = registry.tools_view()
+
     # Remove server tools
     num_removed = registry.remove_server_tools("server1")
     ```
 """
 
 import logging
+from collections.abc import Collection, Iterable, Iterator
 
 from mcp.types import Tool as MCPTool
 
+from agentical.mcp.name_index import ServerNameIndex
+
 logger = logging.getLogger(__name__)
 
 
+class ToolsView(Collection[MCPTool]):
+    """Immutable snapshot of the tools registered at one point in time.
+
+    A query hands the view to the LLM backend, which may iterate it several
+    times across awaits. Taking a snapshot keeps every pass consistent even if
+    servers are reconnected or removed meanwhile. The registry caches the view
+    until its tools change, so repeated queries share one snapshot.
+    """
+
+    __slots__ = ("_names", "_tools")
+
+    def __init__(self, tools: Iterable[MCPTool]):
+        """Initialize the view.
+
+        Args:
+            tools: Tools to expose, in registration order
+        """
+        self._tools = tuple(tools)
+        self._names = frozenset(tool.name for tool in self._tools)
+
+    def __iter__(self) -> Iterator[MCPTool]:
+        """Iterate over the tools in registration order."""
+        return iter(self._tools)
+
+    def __len__(self) -> int:
+        """Return the number of tools."""
+        return len(self._tools)
+
+    def __contains__(self, item: object) -> bool:
+        """Check whether a tool, or a tool name, is part of the view."""
+        if isinstance(item, str):
+            return item in self._names
+        return item in self._tools
+
+
 class ToolRegistry:
     """Manages the registration and lookup of MCP tools.
 
@@ -34,13 +75,31 @@ class ToolRegistry:
 
     Attributes:
         tools_by_server (Dict[str, List[MCPTool]]): Tools indexed by server
-        all_tools (List[MCPTool]): Combined list of all available tools
+        all_tools (List[MCPTool]): Combined list of all available tools, derived
+            from tools_by_server and rebuilt lazily after changes
+        _tool_names (ServerNameIndex): Server hosting each tool name. When
+            several servers expose the same name, the first registered wins.
     """
 
     def __init__(self):
         """Initialize an empty tool registry."""
         self.tools_by_server: dict[str, list[MCPTool]] = {}
-        self.all_tools: list[MCPTool] = []
+        self._all_tools: list[MCPTool] | None = []
+        self._view: ToolsView | None = None
+        self._tool_names = ServerNameIndex()
+
+    @property
+    def all_tools(self) -> list[MCPTool]:
+        """Combined list of all available tools, in registration order."""
+        if self._all_tools is None:
+            self._all_tools = [
+                tool for tools in self.tools_by_server.values() for tool in tools
+            ]
+        return self._all_tools
+
+    def _num_tools(self) -> int:
+        """Count registered tools without materializing all_tools."""
+        return sum(len(tools) for tools in self.tools_by_server.values())
 
     def register_server_tools(self, server_name: str, tools: list[MCPTool]) -> None:
         """Register tools for a specific server.
@@ -51,7 +110,7 @@ class ToolRegistry:
 
         Note:
             If the server already has registered tools, they will be replaced.
-            The all_tools list is updated to include the new tools.
+            The all_tools list is rebuilt on next access to include the new tools.
         """
         logger.debug(
             "Registering tools for server",
@@ -63,11 +122,22 @@ class ToolRegistry:
             self.remove_server_tools(server_name)
 
         self.tools_by_server[server_name] = tools
-        self.all_tools.extend(tools)
+        self._all_tools = None
+        self._view = None
+        shadowed = self._tool_names.add(server_name, (tool.name for tool in tools))
+        for tool_name, owner in shadowed.items():
+            logger.warning(
+                "Tool name already provided by another server",
+                extra={
+                    "tool_name": tool_name,
+                    "server_name": server_name,
+                    "existing_server": owner,
+                },
+            )
 
         logger.debug(
             "Tools registered successfully",
-            extra={"server_name": server_name, "total_tools": len(self.all_tools)},
+            extra={"server_name": server_name, "total_tools": self._num_tools()},
         )
 
     def remove_server_tools(self, server_name: str) -> int:
@@ -80,32 +150,24 @@ class ToolRegistry:
             Number of tools removed
 
         Note:
-            This operation updates both tools_by_server and all_tools collections.
+            This operation updates tools_by_server and invalidates all_tools.
             Tools from other servers are preserved.
         """
         logger.debug("Removing tools for server", extra={"server_name": server_name})
 
         num_tools_removed = 0
         if server_name in self.tools_by_server:
-            server_tools = self.tools_by_server[server_name]
-            num_tools_removed = len(server_tools)
-
-            # Get tools from other servers
-            other_servers_tools = []
-            for other_server, tools in self.tools_by_server.items():
-                if other_server != server_name:
-                    other_servers_tools.extend(tools)
-
-            # Update all_tools
-            self.all_tools = other_servers_tools
-            del self.tools_by_server[server_name]
+            num_tools_removed = len(self.tools_by_server.pop(server_name))
+            self._all_tools = None
+            self._view = None
+            self._tool_names.remove(server_name)
 
             logger.debug(
                 "Server tools removed",
                 extra={
                     "server_name": server_name,
                     "num_tools_removed": num_tools_removed,
-                    "remaining_tools": len(self.all_tools),
+                    "remaining_tools": self._num_tools(),
                 },
             )
 
@@ -121,13 +183,26 @@ class ToolRegistry:
             Server name if found, None otherwise
 
         Note:
-            This is an O(n) operation where n is the total number of tools
-            across all servers. For better performance with large numbers of
-            tools, consider adding an index.
+            This is a single dict lookup. If multiple servers have a tool with
+            the same name, returns the first server that registered it.
         """
-        for server_name, tools in self.tools_by_server.items():
-            if any(tool.name == tool_name for tool in tools):
-                return server_name
+        return self._tool_names.get(tool_name)
+
+    def get_tool(self, tool_name: str) -> MCPTool | None:
+        """Get the tool that calls with this name are dispatched to.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            The tool from the server find_tool_server returns, None if not found
+        """
+        server_name = self._tool_names.get(tool_name)
+        if server_name is None:
+            return None
+        for tool in self.tools_by_server[server_name]:
+            if tool.name == tool_name:
+                return tool
         return None
 
     def clear(self) -> tuple[int, int]:
@@ -140,7 +215,7 @@ class ToolRegistry:
             This operation completely resets the registry state.
             Both tools_by_server and all_tools collections are cleared.
         """
-        num_tools = len(self.all_tools)
+        num_tools = self._num_tools()
         num_servers = len(self.tools_by_server)
 
         logger.debug(
@@ -149,9 +224,22 @@ class ToolRegistry:
         )
 
         self.tools_by_server.clear()
-        self.all_tools.clear()
+        self._tool_names.clear()
+        self._all_tools = []
+        self._view = None
         return num_tools, num_servers
 
+    def tools_view(self) -> ToolsView:
+        """Get a snapshot of the registered tools.
+
+        Returns:
+            An immutable view of the current tools. It is shared between
+            calls until the registered tools change.
+        """
+        if self._view is None:
+            self._view = ToolsView(self.all_tools)
+        return self._view
+
     def get_server_tools(self, server_name: str) -> list[MCPTool]:
         """Get all tools registered for a specific server.
 
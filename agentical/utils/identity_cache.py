@@ -0,0 +1,73 @@
+"""Identity-keyed memoization for unhashable objects.
+
+MCP tools are pydantic models and are not hashable, so functools.lru_cache
+cannot memoize functions that take them. The registries, however, hand the
+same tool objects to the LLM backends on every query until a server is
+reconnected. This cache keys results on object identity and drops each entry
+when its object is garbage collected.
+
+Example:
+    ```python
+    cache = IdentityCache()
+    formatted = cache.get(tool, adapter.convert_mcp_tool_to_openai)
+    ```
+"""
+
+import weakref
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityCache(Generic[T]):
+    """Caches a computed value per object, keyed by the object's identity.
+
+    Note:
+        Cached objects are treated as immutable. Mutating an object in place
+        does not invalidate its entry, and callers must not mutate the values
+        returned from the cache.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: dict[int, tuple[weakref.ref, T]] = {}
+
+    def get(self, obj: Any, compute: Callable[[Any], T]) -> T:
+        """Get the cached value for an object, computing it on a miss.
+
+        Args:
+            obj: Object the value is derived from. Must support weak references.
+            compute: Function computing the value from the object
+
+        Returns:
+            The cached or newly computed value
+        """
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+
+        value = compute(obj)
+        self._entries[key] = (weakref.ref(obj, self._discard_callback(key)), value)
+        return value
+
+    def _discard_callback(self, key: int) -> Callable[[weakref.ref], None]:
+        """Build the callback that removes an entry once its object is gone."""
+        entries = self._entries
+
+        def discard(ref: weakref.ref) -> None:
+            entry = entries.get(key)
+            # The id may already have been reused by a newer entry
+            if entry is not None and entry[0] is ref:
+                del entries[key]
+
+        return discard
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
@@ -0,0 +1,89 @@
+"""Bounded least-recently-used cache base.
+
+The provider keeps several small caches that differ only in how a lookup is
+turned into a key. ``BoundedLRUCache`` holds the shared storage and eviction;
+a subclass supplies ``_key``, which receives the arguments given to ``get``
+and ``put`` (without the value) and returns a hashable key.
+
+Example:
+    ```python
+    class SquareCache(BoundedLRUCache[int]):
+        @staticmethod
+        def _key(n: int) -> int:
+            return n
+
+
+    cache = SquareCache(maxsize=2)
+    cache.put(3, 9)
+    cache.get(3)  # 9
+    ```
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class BoundedLRUCache(Generic[V]):
+    """Bounded LRU cache whose keys are built by the subclass.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept. Must be positive.
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+
+    @staticmethod
+    def _key(*args: Any) -> Hashable:
+        """Build the cache key from the lookup arguments."""
+        raise NotImplementedError
+
+    def get(self, *args: Any) -> V | None:
+        """Get the cached value for a lookup.
+
+        Args:
+            *args: Lookup arguments passed to ``_key``
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        key = self._key(*args)
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, *args: Any) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            *args: Lookup arguments passed to ``_key``, followed by the value
+        """
+        *key_args, value = args
+        key = self._key(*key_args)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
@@ -1,5 +1,6 @@
 """Unit tests for Anthropic backend implementation."""
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -204,6 +205,55 @@ async def test_process_query_with_tool_calls(
     mock_execute_tool.assert_called_once_with("tool1", {"param1": "test"})
 
 
+@pytest.mark.asyncio
+async def test_process_query_keeps_text_before_tool_calls(
+    mock_env_vars, mock_anthropic_client, mock_mcp_tools
+):
+    """Test text sent alongside a tool call is kept in the conversation."""
+    tool_message = Message(
+        id="test1",
+        model="claude-3",
+        role="assistant",
+        type="message",
+        content=[
+            {"type": "text", "text": "Let me check."},
+            {"type": "tool_use", "id": "call1", "name": "tool1", "input": {}},
+        ],
+        stop_reason="tool_use",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=20),
+    )
+    final_message = Message(
+        id="test2",
+        model="claude-3",
+        role="assistant",
+        type="message",
+        content=[{"type": "text", "text": "<answer>Done</answer>"}],
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=20),
+    )
+
+    mock_client = Mock()
+    mock_client.messages.create = AsyncMock(side_effect=[tool_message, final_message])
+    mock_anthropic_client.return_value = mock_client
+
+    backend = AnthropicBackend()
+    response = await backend.process_query(
+        query="test query",
+        tools=mock_mcp_tools,
+        resources=[],
+        prompts=[],
+        execute_tool=AsyncMock(return_value="Tool result"),
+    )
+
+    assert response == "Done"
+    messages = mock_client.messages.create.call_args.kwargs["messages"]
+    assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+    assert [block["type"] for block in messages[1]["content"]] == ["text", "tool_use"]
+    assert messages[1]["content"][0]["text"] == "Let me check."
+
+
 @pytest.mark.asyncio
 async def test_process_query_with_tool_error(
     mock_env_vars, mock_anthropic_client, mock_mcp_tools
@@ -289,7 +339,11 @@ async def test_process_query_with_context(
 
     # Execute test with context
     backend = AnthropicBackend()
-    context = [{"role": "user", "content": "previous message"}]
+    context = [
+        {"role": "user", "content": "previous message"},
+        {"role": "assistant", "content": "previous answer"},
+        {"role": "tool", "content": "ignored"},
+    ]
     response = await backend.process_query(
         query="test query",
         tools=mock_mcp_tools,
@@ -301,6 +355,9 @@ async def test_process_query_with_context(
 
     assert response == "Test response"
     mock_client.messages.create.assert_called_once()
+    messages = mock_client.messages.create.call_args.kwargs["messages"]
+    assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+    assert messages[1]["content"][0]["text"] == "previous answer"
 
 
 @pytest.mark.asyncio
@@ -416,6 +473,75 @@ async def test_process_query_with_multiple_tool_calls(
     mock_execute_tool.assert_any_call("tool1", {"param1": "test2"})
 
 
+@pytest.mark.asyncio
+async def test_process_query_runs_tool_calls_concurrently(
+    mock_env_vars, mock_anthropic_client, mock_mcp_tools
+):
+    """Test tool uses from one response run concurrently and are answered by id."""
+    tool_message = Message(
+        id="test1",
+        model="claude-3",
+        role="assistant",
+        type="message",
+        content=[
+            {"type": "tool_use", "id": f"call{i}", "name": f"tool{i}", "input": {}}
+            for i in (1, 2)
+        ],
+        stop_reason="tool_use",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=20),
+    )
+    final_message = Message(
+        id="test2",
+        model="claude-3",
+        role="assistant",
+        type="message",
+        content=[{"type": "text", "text": "Final response"}],
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=20),
+    )
+    mock_client = Mock()
+    mock_client.messages.create = AsyncMock(side_effect=[tool_message, final_message])
+    mock_anthropic_client.return_value = mock_client
+
+    in_flight = 0
+    peak = 0
+
+    async def execute_tool(name, args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # The first call finishes last
+        await asyncio.sleep(0.02 if name == "tool1" else 0.01)
+        in_flight -= 1
+        if name == "tool2":
+            raise RuntimeError("tool2 failed")
+        return f"{name} result"
+
+    backend = AnthropicBackend()
+    response = await backend.process_query(
+        query="test query",
+        tools=mock_mcp_tools,
+        resources=[],
+        prompts=[],
+        execute_tool=execute_tool,
+    )
+
+    assert response == "Final response"
+    assert peak == 2
+    kwargs = mock_client.messages.create.call_args.kwargs
+    assert kwargs["tool_choice"] == {"type": "auto"}
+    tool_use_turn, results_turn = kwargs["messages"][1:]
+    assert tool_use_turn["role"] == "assistant"
+    assert [block["id"] for block in tool_use_turn["content"]] == ["call1", "call2"]
+    assert results_turn["role"] == "user"
+    assert [
+        (block["tool_use_id"], block["content"], block.get("is_error", False))
+        for block in results_turn["content"]
+    ] == [("call1", "tool1 result", False), ("call2", "tool2 failed", True)]
+
+
 @pytest.mark.asyncio
 async def test_process_query_with_system_content(
     mock_env_vars, mock_anthropic_client, mock_mcp_tools
@@ -503,3 +629,108 @@ async def test_process_query_with_system_content(
     assert "You are an AI assistant" in call_kwargs["system"][0]["text"]
     assert "<thinking>" in call_kwargs["system"][0]["text"]
     assert "<answer>" in call_kwargs["system"][0]["text"]
+
+
+@pytest.mark.asyncio
+async def test_process_query_marks_cache_breakpoints(
+    mock_env_vars, mock_anthropic_client, mock_mcp_tools
+):
+    """Test system, tools and the newest message are marked for prompt caching."""
+    tool_message = Message(
+        id="test1",
+        model="claude-3",
+        role="assistant",
+        type="message",
+        content=[
+            {"type": "tool_use", "id": "call1", "name": "tool1", "input": {}},
+        ],
+        stop_reason="tool_use",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=20),
+    )
+    final_message = Message(
+        id="test2",
+        model="claude-3",
+        role="assistant",
+        type="message",
+        content=[{"type": "text", "text": "Final response"}],
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(input_tokens=10, output_tokens=20),
+    )
+    requests = []
+
+    async def create(**kwargs):
+        # Messages are appended in place, so record which blocks were marked
+        requests.append(
+            {
+                **kwargs,
+                "marked": [
+                    (i, block.get("text", block.get("content")))
+                    for i, message in enumerate(kwargs["messages"])
+                    for block in message["content"]
+                    if "cache_control" in block
+                ],
+            }
+        )
+        return [tool_message, final_message][len(requests) - 1]
+
+    mock_client = AsyncMock()
+    mock_client.messages.create = AsyncMock(side_effect=create)
+    mock_anthropic_client.return_value = mock_client
+
+    backend = AnthropicBackend()
+    await backend.process_query(
+        query="test query",
+        tools=mock_mcp_tools,
+        resources=[],
+        prompts=[],
+        execute_tool=AsyncMock(return_value="Tool result"),
+    )
+
+    ephemeral = {"type": "ephemeral"}
+    for request in requests:
+        assert request["system"][-1]["cache_control"] == ephemeral
+        assert request["tools"][-1]["cache_control"] == ephemeral
+        assert all("cache_control" not in tool for tool in request["tools"][:-1])
+    assert requests[0]["marked"] == [(0, "test query")]
+    assert requests[1]["marked"] == [(2, "Tool result")]
+
+    # Shared converted tools are left unmarked
+    converted = backend.schema_adapter.convert_mcp_tools_to_anthropic(mock_mcp_tools)
+    assert all("cache_control" not in tool for tool in converted)
+
+
+@pytest.mark.asyncio
+async def test_process_query_caching_disabled(
+    mock_env_vars, mock_anthropic_client, mock_mcp_tools
+):
+    """Test no cache breakpoints are sent when caching is disabled."""
+    mock_client = AsyncMock()
+    mock_client.messages.create = AsyncMock(
+        return_value=Message(
+            id="test",
+            model="claude-3",
+            role="assistant",
+            type="message",
+            content=[{"type": "text", "text": "Final response"}],
+            stop_reason="end_turn",
+            stop_sequence=None,
+            usage=Usage(input_tokens=10, output_tokens=20),
+        )
+    )
+    mock_anthropic_client.return_value = mock_client
+
+    backend = AnthropicBackend(
+        cache_system=False, cache_tools=False, cache_messages=False
+    )
+    await backend.process_query(
+        query="test query",
+        tools=mock_mcp_tools,
+        resources=[],
+        prompts=[],
+        execute_tool=AsyncMock(),
+    )
+
+    kwargs = mock_client.messages.create.call_args[1]
+    assert "cache_control" not in str(kwargs)
@@ -1,6 +1,6 @@
 """Unit tests for Anthropic schema adapter."""
 
-from anthropic.types import Message
+from anthropic.types import Message, ToolUseBlock
 from mcp.types import Tool as MCPTool
 
 from agentical.llm.anthropic.schema_adapter import SchemaAdapter
@@ -142,6 +142,27 @@ def test_convert_mcp_tools_to_anthropic():
     assert tool["input_schema"]["required"] == ["param1"]
 
 
+def test_convert_mcp_tools_to_anthropic_reuses_conversions():
+    """Test each tool object is converted only once."""
+    adapter = SchemaAdapter()
+    tools = [
+        MCPTool(name="tool1", inputSchema={"type": "object"}),
+        MCPTool(name="tool2", inputSchema={"type": "object"}),
+    ]
+
+    first = adapter.convert_mcp_tools_to_anthropic(tools)
+    second = adapter.convert_mcp_tools_to_anthropic(tools)
+
+    assert second == first
+    assert all(a is b for a, b in zip(first, second))
+
+    # A new tool object with the same name is converted again
+    replaced = adapter.convert_mcp_tools_to_anthropic(
+        [MCPTool(name="tool1", inputSchema={"type": "object"})]
+    )
+    assert replaced[0] is not first[0]
+
+
 def test_create_user_message():
     """Test creating user messages."""
     adapter = SchemaAdapter()
@@ -189,6 +210,45 @@ def test_create_tool_response_message():
     assert "Tool test_tool error: Failed" in error_msg["content"][0]["text"]
 
 
+def test_create_tool_use_and_results_messages():
+    """Test tool uses and their results are paired by tool use id."""
+    adapter = SchemaAdapter()
+    tool_use = ToolUseBlock(
+        type="tool_use", id="call_1", name="test_tool", input={"param": "value"}
+    )
+
+    tool_use_msg = adapter.create_tool_use_message([tool_use])
+    assert tool_use_msg == {
+        "role": "assistant",
+        "content": [
+            {
+                "type": "tool_use",
+                "id": "call_1",
+                "name": "test_tool",
+                "input": {"param": "value"},
+            }
+        ],
+    }
+
+    with_text = adapter.create_tool_use_message([tool_use], "Let me check.")
+    assert with_text["content"][0] == {"type": "text", "text": "Let me check."}
+    assert with_text["content"][1]["type"] == "tool_use"
+
+    results_msg = adapter.create_tool_results_message(
+        [("call_1", "Success", None), ("call_2", None, "Failed")]
+    )
+    assert results_msg["role"] == "user"
+    assert results_msg["content"] == [
+        {"type": "tool_result", "tool_use_id": "call_1", "content": "Success"},
+        {
+            "type": "tool_result",
+            "tool_use_id": "call_2",
+            "content": "Failed",
+            "is_error": True,
+        },
+    ]
+
+
 def test_extract_tool_calls():
     """Test extracting tool calls from Anthropic messages."""
     adapter = SchemaAdapter()
@@ -278,3 +338,26 @@ def test_convert_mcp_tools_to_anthropic_edge_cases():
     result = adapter.convert_mcp_tools_to_anthropic([tool])
     assert len(result) == 1
     assert result[0]["input_schema"]["properties"] == {}
+
+
+def test_convert_mcp_tool_to_anthropic_uses_input_schema():
+    """Test the schema is taken from inputSchema, the field MCP servers send."""
+    adapter = SchemaAdapter()
+    tool = MCPTool(
+        name="search",
+        description="Search",
+        inputSchema={
+            "type": "object",
+            "title": "SearchArgs",
+            "properties": {"query": {"type": "string", "title": "Query"}},
+            "required": ["query"],
+        },
+    )
+
+    result = adapter.convert_mcp_tool_to_anthropic(tool)
+
+    assert result["input_schema"] == {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"],
+    }
@@ -1,5 +1,6 @@
 """Unit tests for OpenAI backend implementation."""
 
+import asyncio
 import json
 import os
 from unittest.mock import AsyncMock, Mock, patch
@@ -455,6 +456,89 @@ async def test_process_query_with_multiple_tool_calls(
     mock_execute_tool.assert_any_call("tool2", {"param2": 42})
 
 
+@pytest.mark.asyncio
+async def test_process_query_runs_tool_calls_concurrently(
+    mock_env_vars, mock_openai_client, mock_mcp_tools
+):
+    """Test tool calls from one message run concurrently and keep their order."""
+    tool_calls = [
+        {
+            "id": f"call{i}",
+            "type": "function",
+            "function": {"name": f"tool{i}", "arguments": "{}"},
+        }
+        for i in (1, 2)
+    ]
+    mock_completion1 = ChatCompletion(
+        id="test1",
+        choices=[
+            {
+                "finish_reason": "tool_calls",
+                "index": 0,
+                "message": ChatCompletionMessage(
+                    content=None, role="assistant", tool_calls=tool_calls
+                ),
+            }
+        ],
+        created=123,
+        model="test",
+        object="chat.completion",
+    )
+    mock_completion2 = ChatCompletion(
+        id="test2",
+        choices=[
+            {
+                "finish_reason": "stop",
+                "index": 0,
+                "message": ChatCompletionMessage(
+                    content="Final response", role="assistant"
+                ),
+            }
+        ],
+        created=123,
+        model="test",
+        object="chat.completion",
+    )
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(
+        side_effect=[mock_completion1, mock_completion2]
+    )
+    mock_openai_client.return_value = mock_client
+
+    in_flight = 0
+    peak = 0
+
+    async def execute_tool(name, args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # The first call finishes last
+        await asyncio.sleep(0.02 if name == "tool1" else 0.01)
+        in_flight -= 1
+        return f"{name} result"
+
+    backend = OpenAIBackend()
+    response = await backend.process_query(
+        query="test query",
+        tools=mock_mcp_tools,
+        resources=[],
+        prompts=[],
+        execute_tool=execute_tool,
+    )
+
+    assert response == "Final response"
+    assert peak == 2
+    messages = mock_client.chat.completions.create.call_args_list[1][1]["messages"]
+    assert [m["tool_call_id"] for m in messages if m["role"] == "tool"] == [
+        "call1",
+        "call2",
+    ]
+    assert [m["content"] for m in messages if m["role"] == "tool"] == [
+        "tool1 result",
+        "tool2 result",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_process_query_with_invalid_json_tool_args(
     mock_env_vars, mock_openai_client, mock_mcp_tools
@@ -10,6 +10,7 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
+from agentical.mcp import config as config_module
 from agentical.mcp.config import (
     ConfigurationError,
     DictBasedMCPConfigProvider,
@@ -18,6 +19,14 @@ from agentical.mcp.config import (
 from agentical.mcp.schemas import MCPConfig, ServerConfig
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Keep parsed configurations from leaking between tests."""
+    config_module._config_cache.clear()
+    yield
+    config_module._config_cache.clear()
+
+
 @pytest.fixture
 def valid_server_config():
     """Fixture providing a valid server configuration."""
@@ -88,6 +97,26 @@ async def test_file_based_provider_missing_file():
         await provider.load_config()
 
 
+@pytest.mark.asyncio
+async def test_file_based_provider_caches_unchanged_file(tmp_path, valid_config_json):
+    """Test unchanged files are served from cache and changed files re-read."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(valid_config_json))
+    provider = FileBasedMCPConfigProvider(config_path)
+
+    first = await provider.load_config()
+    with patch("builtins.open", side_effect=AssertionError("file re-read")):
+        second = await provider.load_config()
+
+    assert second == first
+    assert second["test_server"] is not first["test_server"]
+
+    valid_config_json["test_server"]["args"] = ["--changed", "--args"]
+    config_path.write_text(json.dumps(valid_config_json))
+    third = await provider.load_config()
+    assert third["test_server"].args == ["--changed", "--args"]
+
+
 @pytest.mark.asyncio
 async def test_file_based_provider_invalid_config():
     """Test FileBasedMCPConfigProvider with invalid configuration format."""
@@ -245,6 +274,10 @@ async def test_server_config_validation():
     with pytest.raises(ValueError, match="All args must be non-empty strings"):
         ServerConfig(command="test", args=["valid", "   "])
 
+    # Test non-positive timeout
+    with pytest.raises(ValueError):
+        ServerConfig(command="test", timeout_seconds=0)
+
 
 @pytest.mark.asyncio
 async def test_mcp_config_validation():
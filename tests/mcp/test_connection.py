@@ -4,7 +4,9 @@ This module contains tests for the MCPConnectionService and MCPConnectionManager
 classes, which handle server connections and health monitoring.
 """
 
+import asyncio
 from contextlib import AsyncExitStack
+from datetime import timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -174,6 +176,30 @@ async def test_connection_manager_connect(exit_stack, server_config):
                 await manager.connect("", server_config)
 
 
+@pytest.mark.asyncio
+async def test_connection_manager_applies_request_timeout(exit_stack):
+    """Test that a configured timeout bounds each request to the server."""
+    manager = connection.MCPConnectionManager(exit_stack)
+    config = ServerConfig(command="test_command", timeout_seconds=2.5)
+
+    with patch("agentical.mcp.connection.stdio_client") as mock_stdio:
+        mock_stdio.return_value = AsyncMock()
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+
+        with patch("agentical.mcp.connection.ClientSession") as mock_client:
+            mock_client.return_value = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = MockClientSession()
+
+            await manager.connect("server1", config)
+            assert mock_client.call_args.kwargs["read_timeout_seconds"] == timedelta(
+                seconds=2.5
+            )
+
+            await manager.cleanup("server1")
+            await manager.connect("server1", ServerConfig(command="test_command"))
+            assert mock_client.call_args.kwargs["read_timeout_seconds"] is None
+
+
 @pytest.mark.asyncio
 async def test_connection_manager_disconnect(exit_stack, server_config):
     """Test MCPConnectionManager disconnection functionality."""
@@ -253,6 +279,36 @@ async def test_connection_manager_connect_retry_failure(exit_stack, server_confi
         assert "server1" not in manager.writes
 
 
+@pytest.mark.asyncio
+async def test_connection_manager_retries_with_growing_delay(exit_stack, server_config):
+    """Test failed attempts are retried up to MAX_RETRIES with doubling delays."""
+    manager = connection.MCPConnectionManager(exit_stack)
+    mock_session = MockClientSession()
+    attempts = ConnectionError("refused"), ConnectionError("refused"), None
+
+    with (
+        patch.object(
+            manager,
+            "_connect_once",
+            new_callable=AsyncMock,
+            side_effect=[
+                e or connection.ServerRecord(mock_session, Mock(), Mock())
+                for e in attempts
+            ],
+        ) as mock_connect_once,
+        patch("agentical.mcp.connection.asyncio.sleep", new_callable=AsyncMock),
+        patch("agentical.mcp.connection.random.uniform", side_effect=max) as uniform,
+    ):
+        session = await manager.connect("server1", server_config)
+
+    assert session is mock_session
+    assert mock_connect_once.await_count == manager.MAX_RETRIES
+    assert [c.args for c in uniform.call_args_list] == [
+        (0, manager.BASE_DELAY),
+        (0, manager.BASE_DELAY * 2),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_connection_manager_cleanup_nonexistent_server(exit_stack):
     """Test cleaning up a non-existent server."""
@@ -271,6 +327,244 @@ async def test_connection_manager_cleanup_all_empty(exit_stack):
     await manager.cleanup_all()
 
 
+@pytest.mark.asyncio
+async def test_connection_manager_cleanup_releases_only_that_server(
+    exit_stack, server_config
+):
+    """Test cleanup closes the server's own transport and leaves others open."""
+    manager = connection.MCPConnectionManager(exit_stack)
+    transports = {}
+
+    def make_transport(params):
+        transport = AsyncMock()
+        transport.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        transports[len(transports) + 1] = transport
+        return transport
+
+    with (
+        patch("agentical.mcp.connection.stdio_client", side_effect=make_transport),
+        patch("agentical.mcp.connection.ClientSession") as mock_client,
+    ):
+        mock_client.return_value = AsyncMock()
+        mock_client.return_value.__aenter__.side_effect = [
+            MockClientSession(),
+            MockClientSession(),
+        ]
+
+        await manager.connect("server1", server_config)
+        await manager.connect("server2", server_config)
+        assert set(manager.servers) == {"server1", "server2"}
+        assert all(not r.owner.done() for r in manager.servers.values())
+
+        await manager.cleanup("server1")
+
+        transports[1].__aexit__.assert_awaited_once()
+        transports[2].__aexit__.assert_not_awaited()
+        assert set(manager.servers) == {"server2"}
+
+        await manager.cleanup_all()
+        transports[2].__aexit__.assert_awaited_once()
+        assert not manager.servers
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_cleanup_all_closes_servers_concurrently(
+    exit_stack, server_config
+):
+    """Test cleanup_all stops all servers concurrently."""
+    manager = connection.MCPConnectionManager(exit_stack)
+    for name in ("server1", "server2", "server3"):
+        manager.servers[name] = connection.ServerRecord(
+            MockClientSession(), None, None, config=server_config
+        )
+    in_flight = 0
+    peak = 0
+
+    async def slow_stop(record):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    with patch.object(manager, "_stop_owner", side_effect=slow_stop):
+        await manager.cleanup_all()
+
+    assert peak == 3
+    assert not manager.servers
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_cancelled_attempt_closes_stack(
+    exit_stack, server_config
+):
+    """Test cancelling a connect waits for the transport it opened to close."""
+    manager = connection.MCPConnectionManager(exit_stack)
+    initializing = asyncio.Event()
+
+    async def hang():
+        initializing.set()
+        await asyncio.Event().wait()
+
+    session = MockClientSession()
+    session.initialize = hang
+    closed = False
+
+    async def slow_close(*exc_info):
+        nonlocal closed
+        await asyncio.sleep(0.01)
+        closed = True
+
+    with (
+        patch("agentical.mcp.connection.stdio_client") as mock_stdio,
+        patch("agentical.mcp.connection.ClientSession") as mock_client,
+    ):
+        mock_stdio.return_value = AsyncMock()
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        mock_stdio.return_value.__aexit__.side_effect = slow_close
+        mock_client.return_value = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = session
+
+        task = asyncio.create_task(manager.connect("server1", server_config))
+        await initializing.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert closed
+        assert "server1" not in manager.servers
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_owner_cancelled_before_ready(
+    exit_stack, server_config
+):
+    """Test a connect fails instead of hanging when its owner is cancelled."""
+    manager = connection.MCPConnectionManager(exit_stack)
+
+    async def cancelled_initialize():
+        raise asyncio.CancelledError
+
+    session = MockClientSession()
+    session.initialize = cancelled_initialize
+
+    with (
+        patch("agentical.mcp.connection.stdio_client") as mock_stdio,
+        patch("agentical.mcp.connection.ClientSession") as mock_client,
+        patch("agentical.mcp.connection.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        mock_stdio.return_value = AsyncMock()
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        mock_client.return_value = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = session
+
+        with pytest.raises(ConnectionError, match="ended before ready"):
+            await asyncio.wait_for(manager.connect("server1", server_config), 1)
+
+        assert "server1" not in manager.servers
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_rejects_concurrent_connect(exit_stack, server_config):
+    """Test a second connect for a name that is still connecting is rejected."""
+    manager = connection.MCPConnectionManager(exit_stack)
+    initializing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_initialize():
+        initializing.set()
+        await release.wait()
+
+    session = MockClientSession()
+    session.initialize = slow_initialize
+
+    with (
+        patch("agentical.mcp.connection.stdio_client") as mock_stdio,
+        patch("agentical.mcp.connection.ClientSession") as mock_client,
+    ):
+        mock_stdio.return_value = AsyncMock()
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        mock_client.return_value = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = session
+
+        first = asyncio.create_task(manager.connect("server1", server_config))
+        await initializing.wait()
+        with pytest.raises(ValueError, match="already connecting"):
+            await manager.connect("server1", server_config)
+
+        release.set()
+        assert await first is session
+        record = manager.servers["server1"]
+        assert not record.owner.done()
+
+        await manager.cleanup("server1")
+        assert record.owner.done()
+
+
+@pytest.mark.asyncio
+async def test_connection_service_duplicate_connect_keeps_health(
+    exit_stack, server_config
+):
+    """Test a rejected duplicate connect does not mark the server failed."""
+    service = connection.MCPConnectionService(exit_stack)
+    initializing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_initialize():
+        initializing.set()
+        await release.wait()
+
+    session = MockClientSession()
+    session.initialize = slow_initialize
+
+    with (
+        patch("agentical.mcp.connection.stdio_client") as mock_stdio,
+        patch("agentical.mcp.connection.ClientSession") as mock_client,
+        patch.object(service._health_monitor, "start_monitoring"),
+    ):
+        mock_stdio.return_value = AsyncMock()
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        mock_client.return_value = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = session
+
+        first = asyncio.create_task(service.connect("server1", server_config))
+        await initializing.wait()
+        with pytest.raises(ValueError, match="already connecting"):
+            await service.connect("server1", server_config)
+
+        release.set()
+        assert await first is session
+
+        health = service._health_monitor.server_health["server1"]
+        assert health.consecutive_failures == 0
+        assert health.last_error is None
+
+        await service.cleanup("server1")
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_failed_attempt_closes_stack(
+    exit_stack, server_config
+):
+    """Test a failed connection attempt releases the transport it opened."""
+    manager = connection.MCPConnectionManager(exit_stack)
+
+    with (
+        patch("agentical.mcp.connection.stdio_client") as mock_stdio,
+        patch("agentical.mcp.connection.ClientSession") as mock_client,
+    ):
+        mock_stdio.return_value = AsyncMock()
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        mock_client.return_value = AsyncMock()
+        mock_client.return_value.__aenter__.side_effect = Exception("init failed")
+
+        with pytest.raises(ConnectionError):
+            await manager.connect("server1", server_config)
+
+        assert mock_stdio.return_value.__aexit__.await_count >= 1
+        assert "server1" not in manager.servers
+
+
 @pytest.mark.asyncio
 async def test_connection_service_connect_failure(exit_stack, server_config):
     """Test connection service handling of connection failures."""
@@ -356,12 +650,15 @@ async def test_connection_service_reconnect_success(exit_stack, server_config):
         # First connect to establish the session and store config
         await service.connect("server1", server_config)
         # Manually store the session and config since the mock doesn't do it
-        service._connection_manager.sessions["server1"] = mock_session
-        service._connection_manager._configs["server1"] = server_config
+        service._connection_manager.servers["server1"] = connection.ServerRecord(
+            mock_session, None, None, config=server_config
+        )
 
         # Test reconnection
         success = await service.reconnect("server1")
-        assert success, f"Reconnect failed. Sessions: {service._connection_manager.sessions}, Configs: {service._connection_manager._configs}"
+        assert success, (
+            f"Reconnect failed. Servers: {service._connection_manager.servers}"
+        )
         assert service.get_session("server1") is not None
 
         # Verify cleanup was called before reconnect
@@ -396,7 +693,9 @@ async def test_connection_service_reconnect_no_config(exit_stack, server_config)
     ):
         # Connect but don't store config
         await service.connect("server1", server_config)
-        service._connection_manager._configs.clear()  # Clear stored config
+        service._connection_manager.servers["server1"] = connection.ServerRecord(
+            mock_session, None, None
+        )
 
         # Attempt reconnection
         success = await service.reconnect("server1")
@@ -0,0 +1,58 @@
+"""Unit tests for the name-to-server index shared by the registries."""
+
+from agentical.mcp.name_index import ServerNameIndex
+
+
+def test_first_registered_server_wins():
+    """Test a name resolves to the first server that provided it."""
+    index = ServerNameIndex()
+    assert index.add("server1", ["a", "b"]) == {}
+    assert index.add("server2", ["b", "c"]) == {"b": "server1"}
+
+    assert index.get("a") == "server1"
+    assert index.get("b") == "server1"
+    assert index.get("c") == "server2"
+    assert index.get("nonexistent") is None
+    assert "server2" in index
+
+
+def test_remove_hands_names_to_next_server():
+    """Test removing a server moves its names to the next provider."""
+    index = ServerNameIndex()
+    index.add("server1", ["a", "b"])
+    index.add("server2", ["b"])
+    index.add("server3", ["b", "c"])
+
+    index.remove("server1")
+    assert "server1" not in index
+    assert index.get("a") is None
+    assert index.get("b") == "server2"
+
+    # Removing a server that does not own a name leaves it alone
+    index.remove("server3")
+    assert index.get("b") == "server2"
+    assert index.get("c") is None
+
+    # Removing an unknown server is a no-op
+    index.remove("nonexistent")
+
+
+def test_add_replaces_server_names():
+    """Test re-adding a server drops names it no longer provides."""
+    index = ServerNameIndex()
+    index.add("server1", ["a", "b"])
+    index.add("server2", ["b"])
+
+    index.add("server1", ["a"])
+    assert index.get("a") == "server1"
+    assert index.get("b") == "server2"
+
+
+def test_clear():
+    """Test clearing the index."""
+    index = ServerNameIndex()
+    index.add("server1", ["a"])
+
+    index.clear()
+    assert index.get("a") is None
+    assert "server1" not in index
@@ -103,6 +103,14 @@ async def test_find_prompt_server(prompt_registry, sample_prompts):
     assert server is None
 
 
+async def test_get_prompt(prompt_registry, sample_prompts):
+    """Test getting a prompt by name from the server that hosts it."""
+    prompt_registry.register_server_prompts("server1", sample_prompts)
+
+    assert prompt_registry.get_prompt("prompt1") is sample_prompts[0]
+    assert prompt_registry.get_prompt("nonexistent") is None
+
+
 async def test_clear(prompt_registry, sample_prompts):
     """Test clearing all prompts."""
     # Register prompts for multiple servers
@@ -207,14 +215,14 @@ async def test_clear_error_handling(prompt_registry, sample_prompts):
     prompt_registry.register_server_prompts("server1", sample_prompts)
 
     # Mock an error during clearing
-    original_prompts = prompt_registry.all_prompts
-    prompt_registry.all_prompts = None  # This will cause an error
+    original_prompts = prompt_registry.prompts_by_server
+    prompt_registry.prompts_by_server = None  # This will cause an error
 
     with pytest.raises(Exception):
         prompt_registry.clear()
 
     # Restore the prompts to avoid affecting other tests
-    prompt_registry.all_prompts = original_prompts
+    prompt_registry.prompts_by_server = original_prompts
 
 
 async def test_register_server_prompts_empty_list(prompt_registry):
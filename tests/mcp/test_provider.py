@@ -4,16 +4,17 @@ This module contains tests for the MCPToolProvider class, which serves as the ma
 integration layer between LLM backends and MCP tools.
 """
 
+import asyncio
 from contextlib import AsyncExitStack
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from mcp.types import CallToolResult
-from mcp.types import Tool as MCPTool
+from mcp.types import Tool as MCPTool, ToolAnnotations
 from mcp.types import Resource as MCPResource
 from mcp.types import Prompt as MCPPrompt
 
-from agentical.api import LLMBackend
+from agentical.api import NO_RESPONSE, LLMBackend
 from agentical.mcp.config import DictBasedMCPConfigProvider
 from agentical.mcp.provider import MCPToolProvider
 from agentical.mcp.schemas import ServerConfig
@@ -143,6 +144,37 @@ async def mock_exit_stack():
         yield stack
 
 
+@pytest.fixture
+def read_only_cache_provider(mock_llm_backend, valid_server_configs):
+    """Fixture providing a response-caching provider with one read-only tool.
+
+    The backend calls that tool and answers "found" even if the call fails.
+    """
+    provider = MCPToolProvider(
+        mock_llm_backend, server_configs=valid_server_configs, response_cache_size=4
+    )
+    provider.tool_registry.register_server_tools(
+        "server1",
+        [
+            MCPTool(
+                name="search",
+                inputSchema={"type": "object", "properties": {}},
+                annotations=ToolAnnotations(readOnlyHint=True),
+            )
+        ],
+    )
+
+    async def process_query(**kwargs):
+        try:
+            await kwargs["execute_tool"]("search", {})
+        except Exception:
+            pass
+        return "found"
+
+    mock_llm_backend.process_query.side_effect = process_query
+    return provider
+
+
 @pytest.mark.asyncio
 async def test_provider_initialization(mock_llm_backend, valid_server_configs):
     """Test MCPToolProvider initialization."""
@@ -161,6 +193,14 @@ async def test_provider_initialization(mock_llm_backend, valid_server_configs):
     ):
         MCPToolProvider(mock_llm_backend)
 
+    # Test with an invalid connection limit
+    with pytest.raises(ValueError, match="max_concurrent_connects must be at least 1"):
+        MCPToolProvider(
+            mock_llm_backend,
+            server_configs=valid_server_configs,
+            max_concurrent_connects=0,
+        )
+
 
 @pytest.mark.asyncio
 async def test_provider_initialize(mock_llm_backend, valid_server_configs):
@@ -261,6 +301,104 @@ async def test_provider_query_processing(
         assert response is not None
 
 
+@pytest.mark.asyncio
+async def test_process_query_response_cache(
+    mock_llm_backend, valid_server_configs, mock_mcp_tools
+):
+    """Test repeated queries are answered from the response cache."""
+    provider = MCPToolProvider(
+        mock_llm_backend, server_configs=valid_server_configs, response_cache_size=4
+    )
+    provider.tool_registry.register_server_tools("server1", mock_mcp_tools)
+    mock_llm_backend.process_query.return_value = "answer"
+
+    assert await provider.process_query("Test query") == "answer"
+    assert await provider.process_query("  Test query ") == "answer"
+    assert mock_llm_backend.process_query.await_count == 1
+
+    # A different tool set is a different question
+    provider.tool_registry.remove_server_tools("server1")
+    await provider.process_query("Test query")
+    assert mock_llm_backend.process_query.await_count == 2
+
+    await provider.cleanup_all()
+    assert len(provider.response_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_process_query_response_cache_skips_uncacheable_answers(
+    mock_llm_backend, valid_server_configs
+):
+    """Test fallback answers and answers built on mutating tools are not cached."""
+    provider = MCPToolProvider(
+        mock_llm_backend, server_configs=valid_server_configs, response_cache_size=4
+    )
+    schema = {"type": "object", "properties": {}}
+    provider.tool_registry.register_server_tools(
+        "server1",
+        [
+            MCPTool(
+                name="search",
+                inputSchema=schema,
+                annotations=ToolAnnotations(readOnlyHint=True),
+            ),
+            MCPTool(name="write_file", inputSchema=schema),
+        ],
+    )
+
+    def answer_with(tool_name, response):
+        async def process_query(**kwargs):
+            if tool_name is not None:
+                await kwargs["execute_tool"](tool_name, {})
+            return response
+
+        mock_llm_backend.process_query.side_effect = process_query
+
+    ok = CallToolResult(content=[])
+    with patch.object(
+        provider, "execute_tool", AsyncMock(return_value=ok)
+    ) as execute_tool:
+        answer_with(None, NO_RESPONSE)
+        await provider.process_query("empty")
+        answer_with("write_file", "written")
+        await provider.process_query("write")
+        assert len(provider.response_cache) == 0
+        assert execute_tool.await_count == 1
+
+        answer_with("search", "found")
+        await provider.process_query("search")
+        assert await provider.process_query("search") == "found"
+        assert len(provider.response_cache) == 1
+        assert execute_tool.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_query_response_cache_skips_failed_tool_call(
+    read_only_cache_provider,
+):
+    """Test an answer is not cached when one of its tool calls raised."""
+    provider = read_only_cache_provider
+    with patch.object(
+        provider, "execute_tool", AsyncMock(side_effect=ConnectionError("down"))
+    ):
+        assert await provider.process_query("search") == "found"
+
+    assert len(provider.response_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_process_query_response_cache_skips_error_tool_result(
+    read_only_cache_provider,
+):
+    """Test an answer is not cached when one of its tool calls returned isError."""
+    provider = read_only_cache_provider
+    error = CallToolResult(content=[], isError=True)
+    with patch.object(provider, "execute_tool", AsyncMock(return_value=error)):
+        assert await provider.process_query("search") == "found"
+
+    assert len(provider.response_cache) == 0
+
+
 @pytest.mark.asyncio
 async def test_execute_tool_success(
     mock_llm_backend, valid_server_configs, mock_mcp_tools, mock_exit_stack
@@ -385,6 +523,66 @@ async def test_mcp_connect_prompt_error(
         await provider.mcp_connect("server1")
 
 
+@pytest.mark.asyncio
+async def test_mcp_connect_discovers_concurrently(
+    mock_llm_backend, valid_server_configs, mock_session, mock_mcp_tools
+):
+    """Test that tools, resources and prompts are listed concurrently."""
+    provider = MCPToolProvider(mock_llm_backend, server_configs=valid_server_configs)
+    await provider.initialize()
+
+    session = mock_session()
+    prompts_listed = asyncio.Event()
+
+    async def list_tools():
+        # Only completes if list_prompts runs while list_tools is pending
+        await asyncio.wait_for(prompts_listed.wait(), timeout=1)
+        return Mock(tools=mock_mcp_tools)
+
+    async def list_prompts():
+        prompts_listed.set()
+        return Mock(prompts=[])
+
+    session.list_tools = list_tools
+    session.list_prompts = list_prompts
+
+    with patch.object(
+        provider.connection_service._connection_manager,
+        "connect",
+        return_value=session,
+    ):
+        await provider.mcp_connect("server1")
+
+    assert provider.tool_registry.find_tool_server("tool1") == "server1"
+
+
+@pytest.mark.asyncio
+async def test_mcp_connect_follows_tool_pages(
+    mock_llm_backend, valid_server_configs, mock_session, mock_mcp_tools
+):
+    """Test tools from every page of a paginated listing are registered."""
+    provider = MCPToolProvider(mock_llm_backend, server_configs=valid_server_configs)
+    await provider.initialize()
+
+    session = mock_session()
+    session.list_tools = AsyncMock(
+        side_effect=[
+            Mock(tools=mock_mcp_tools[:1], nextCursor="page2"),
+            Mock(tools=mock_mcp_tools[1:], nextCursor=None),
+        ]
+    )
+
+    with patch.object(
+        provider.connection_service._connection_manager,
+        "connect",
+        return_value=session,
+    ):
+        await provider.mcp_connect("server1")
+
+    assert session.list_tools.await_args_list[1].args == ("page2",)
+    assert provider.tool_registry.all_tools == mock_mcp_tools
+
+
 @pytest.mark.asyncio
 async def test_mcp_connect_all_error(mock_llm_backend, valid_server_configs):
     """Test error handling in connect_all."""
@@ -538,6 +736,39 @@ async def test_execute_tool_error(
                 await provider.execute_tool("tool1", {})
 
 
+@pytest.mark.asyncio
+async def test_execute_tool_caches_read_only_results(
+    mock_llm_backend, valid_server_configs
+):
+    """Test only read-only tool results are served from the cache."""
+    provider = MCPToolProvider(
+        mock_llm_backend, server_configs=valid_server_configs, tool_cache_size=8
+    )
+    schema = {"type": "object", "properties": {}}
+    provider.tool_registry.register_server_tools(
+        "server1",
+        [
+            MCPTool(
+                name="search",
+                inputSchema=schema,
+                annotations=ToolAnnotations(readOnlyHint=True),
+            ),
+            MCPTool(name="write_file", inputSchema=schema),
+        ],
+    )
+    session = Mock()
+    session.call_tool = AsyncMock(return_value=CallToolResult(content=[]))
+
+    with patch.object(provider.connection_service, "get_session", return_value=session):
+        for _ in range(2):
+            await provider.execute_tool("search", {"query": "a"})
+            await provider.execute_tool("write_file", {"path": "a"})
+        assert session.call_tool.await_count == 3
+
+        await provider.cleanup_server("server1")
+        assert len(provider.tool_cache) == 0
+
+
 @pytest.mark.asyncio
 async def test_get_resource_error(
     mock_llm_backend, valid_server_configs, mock_session, mock_exit_stack
@@ -1002,6 +1233,131 @@ async def test_connect_all_partial_failure(
         assert "server1" not in provider.tool_registry.tools_by_server
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("concurrent_startup", "max_concurrent_connects", "expected_peak"),
+    [(True, 8, 2), (True, 1, 1), (False, 8, 1)],
+)
+async def test_connect_all_concurrent_startup(
+    mock_llm_backend,
+    valid_server_configs,
+    mock_session,
+    mock_exit_stack,
+    concurrent_startup,
+    max_concurrent_connects,
+    expected_peak,
+):
+    """Test servers are connected concurrently, up to the limit, unless disabled."""
+    provider = MCPToolProvider(
+        mock_llm_backend,
+        server_configs=valid_server_configs,
+        concurrent_startup=concurrent_startup,
+        max_concurrent_connects=max_concurrent_connects,
+    )
+    provider.exit_stack = mock_exit_stack
+    await provider.initialize()
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_connect(server_name, config):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock_session(server_name)
+
+    with patch.object(
+        provider.connection_service._connection_manager,
+        "connect",
+        side_effect=slow_connect,
+    ):
+        results = await provider.mcp_connect_all()
+
+    assert peak == expected_peak
+    assert results == [("server1", None), ("server2", None)]
+
+
+@pytest.mark.asyncio
+async def test_connect_all_registers_in_config_order(
+    mock_llm_backend,
+    valid_server_configs,
+    mock_session,
+    mock_exit_stack,
+    mock_mcp_tools,
+    mock_mcp_resources,
+    mock_mcp_prompts,
+):
+    """Test a shared name goes to the first configured server, not the fastest."""
+    provider = MCPToolProvider(mock_llm_backend, server_configs=valid_server_configs)
+    provider.exit_stack = mock_exit_stack
+    await provider.initialize()
+
+    server2_connected = asyncio.Event()
+
+    async def mock_connect(server_name, config):
+        if server_name == "server1":
+            await server2_connected.wait()
+        else:
+            server2_connected.set()
+        return mock_session(server_name)
+
+    with patch.object(
+        provider.connection_service._connection_manager,
+        "connect",
+        side_effect=mock_connect,
+    ):
+        results = await provider.mcp_connect_all()
+
+    assert results == [("server1", None), ("server2", None)]
+    assert list(provider.tool_registry.tools_by_server) == ["server1", "server2"]
+    tool_name = mock_mcp_tools[0].name
+    assert provider.tool_registry.find_tool_server(tool_name) == "server1"
+    resource_name = mock_mcp_resources[0].name
+    assert provider.resource_registry.find_resource_server(resource_name) == "server1"
+    prompt_name = mock_mcp_prompts[0].name
+    assert provider.prompt_registry.find_prompt_server(prompt_name) == "server1"
+
+
+@pytest.mark.asyncio
+async def test_connect_all_logs_single_summary(
+    mock_llm_backend, valid_server_configs, mock_session, caplog
+):
+    """Test that connect_all logs one summary naming the failed servers."""
+    provider = MCPToolProvider(mock_llm_backend, server_configs=valid_server_configs)
+    await provider.initialize()
+
+    async def mock_connect(server_name, config):
+        if server_name == "server1":
+            raise ConnectionError("Failed to connect")
+        return mock_session(server_name)
+
+    with (
+        patch.object(
+            provider.connection_service._connection_manager,
+            "connect",
+            side_effect=mock_connect,
+        ),
+        caplog.at_level("INFO", logger="agentical.mcp.provider"),
+    ):
+        await provider.mcp_connect_all()
+
+    successes = [
+        r for r in caplog.records if r.getMessage() == "Server connection successful"
+    ]
+    assert [r.server_name for r in successes] == ["server2"]
+
+    summaries = [
+        r
+        for r in caplog.records
+        if r.getMessage() == "All server connections completed"
+    ]
+    assert len(summaries) == 1
+    assert summaries[0].failed_servers == ["server1"]
+    assert summaries[0].successful_connections == 1
+
+
 @pytest.mark.asyncio
 async def test_cleanup_all_error_handling(
     mock_llm_backend, valid_server_configs, mock_session, mock_exit_stack
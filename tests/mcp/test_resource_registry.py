@@ -105,6 +105,14 @@ async def test_find_resource_server(resource_registry, sample_resources):
     assert server is None
 
 
+async def test_get_resource(resource_registry, sample_resources):
+    """Test getting a resource by name from the server that hosts it."""
+    resource_registry.register_server_resources("server1", sample_resources)
+
+    assert resource_registry.get_resource("resource1") is sample_resources[0]
+    assert resource_registry.get_resource("nonexistent") is None
+
+
 async def test_clear(resource_registry, sample_resources):
     """Test clearing all resources."""
     # Register resources for multiple servers
@@ -248,14 +256,14 @@ async def test_clear_error_handling(resource_registry, sample_resources):
     resource_registry.register_server_resources("server1", sample_resources)
 
     # Mock an error during clearing
-    original_resources = resource_registry.all_resources
-    resource_registry.all_resources = None  # This will cause an error
+    original_resources = resource_registry.resources_by_server
+    resource_registry.resources_by_server = None  # This will cause an error
 
     with pytest.raises(Exception):
         resource_registry.clear()
 
     # Restore the resources to avoid affecting other tests
-    resource_registry.all_resources = original_resources
+    resource_registry.resources_by_server = original_resources
 
 
 async def test_register_server_resources_empty_list(resource_registry):
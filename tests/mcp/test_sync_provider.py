@@ -0,0 +1,98 @@
+"""Unit tests for the synchronous MCPClientWrapper facade."""
+
+import asyncio
+import concurrent.futures
+import sys
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from agentical.api import LLMBackend
+from agentical.mcp.provider import MCPToolProvider
+from agentical.mcp.schemas import ServerConfig
+from agentical.mcp.sync_provider import (
+    AsyncLoopThread,
+    MCPClientWrapper,
+    new_event_loop,
+)
+
+
+@pytest.fixture
+def provider():
+    """Fixture providing a provider whose server connections are mocked."""
+    backend = Mock(spec=LLMBackend)
+    backend.process_query = AsyncMock(return_value="response")
+    provider = MCPToolProvider(
+        backend,
+        server_configs={"server1": ServerConfig(command="cmd1", args=[])},
+    )
+    return provider
+
+
+@pytest.fixture
+def loop_thread():
+    """Fixture providing a running loop thread that is stopped afterwards."""
+    thread = AsyncLoopThread()
+    yield thread
+    thread.stop(timeout=5)
+
+
+def test_loop_thread_runs_coroutines_off_thread(loop_thread):
+    """Test coroutines run on the background loop thread."""
+
+    async def current_thread_name():
+        return threading.current_thread().name
+
+    assert loop_thread.run(current_thread_name()) == "agentical-event-loop"
+
+
+def test_new_event_loop_prefers_uvloop():
+    """Test the loop factory uses uvloop only when it is importable."""
+    fake_uvloop = Mock()
+    fake_uvloop.new_event_loop.return_value = "uvloop-loop"
+    with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+        assert new_event_loop() == "uvloop-loop"
+
+    with patch.dict(sys.modules, {"uvloop": None}):
+        loop = new_event_loop()
+    try:
+        assert isinstance(loop, asyncio.AbstractEventLoop)
+    finally:
+        loop.close()
+
+
+def test_loop_thread_timeout(loop_thread):
+    """Test a blocking call gives up after the timeout."""
+    with pytest.raises(concurrent.futures.TimeoutError):
+        loop_thread.run(asyncio.sleep(10), timeout=0.01)
+
+
+def test_loop_thread_stopped(loop_thread):
+    """Test calls are rejected once the loop thread has stopped."""
+    loop_thread.stop(timeout=5)
+    with pytest.raises(RuntimeError, match="not running"):
+        loop_thread.run(asyncio.sleep(0))
+
+
+def test_wrapper_shares_sessions_across_calls(provider):
+    """Test the provider keeps its state between blocking calls."""
+    session = Mock()
+    session.list_tools = AsyncMock(return_value=Mock(tools=[]))
+    session.list_resources = AsyncMock(return_value=Mock(resources=[]))
+    session.list_prompts = AsyncMock(return_value=Mock(prompts=[]))
+
+    with patch.object(
+        provider.connection_service._connection_manager,
+        "connect",
+        new_callable=AsyncMock,
+        return_value=session,
+    ):
+        with MCPClientWrapper(provider, timeout=5) as client:
+            client.initialize()
+            assert client.mcp_connect_all() == [("server1", None)]
+            assert client.process_query("hello") == "response"
+            loop_thread = client._loop_thread
+
+    provider.llm_backend.process_query.assert_awaited_once()
+    assert not loop_thread.is_running
@@ -0,0 +1,73 @@
+"""Unit tests for ToolResultCache."""
+
+import pytest
+from mcp.types import CallToolResult, TextContent, ToolAnnotations
+from mcp.types import Tool as MCPTool
+
+from agentical.mcp.tool_cache import ToolResultCache, is_cacheable_tool
+
+
+def make_result(text: str) -> CallToolResult:
+    """Build a text tool result."""
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+def make_tool(annotations: ToolAnnotations | None) -> MCPTool:
+    """Build a tool with the given annotations."""
+    return MCPTool(
+        name="search",
+        description="Search",
+        inputSchema={"type": "object", "properties": {}},
+        annotations=annotations,
+    )
+
+
+def test_cache_ignores_argument_order():
+    """Test calls with the same arguments in any order share an entry."""
+    cache = ToolResultCache(maxsize=4)
+    result = make_result("found")
+
+    cache.put("search", {"query": "mcp", "limit": 5}, result)
+
+    assert cache.get("search", {"limit": 5, "query": "mcp"}) is result
+    assert cache.get("search", {"query": "other", "limit": 5}) is None
+    assert cache.get("fetch", {"query": "mcp", "limit": 5}) is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when full."""
+    cache = ToolResultCache(maxsize=2)
+    cache.put("tool", {"n": 1}, make_result("1"))
+    cache.put("tool", {"n": 2}, make_result("2"))
+
+    # Touch the first entry so the second becomes the oldest
+    assert cache.get("tool", {"n": 1}) is not None
+    cache.put("tool", {"n": 3}, make_result("3"))
+
+    assert len(cache) == 2
+    assert cache.get("tool", {"n": 2}) is None
+    assert cache.get("tool", {"n": 1}) is not None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_rejects_invalid_size():
+    """Test the cache requires a positive size."""
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        ToolResultCache(maxsize=0)
+
+
+@pytest.mark.parametrize(
+    "annotations,expected",
+    [
+        (None, False),
+        (ToolAnnotations(), False),
+        (ToolAnnotations(readOnlyHint=False), False),
+        (ToolAnnotations(readOnlyHint=True), True),
+    ],
+)
+def test_is_cacheable_tool(annotations, expected):
+    """Test only tools annotated as read-only are cacheable."""
+    assert is_cacheable_tool(make_tool(annotations)) is expected
+    assert is_cacheable_tool(None) is False
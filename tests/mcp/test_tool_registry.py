@@ -81,6 +81,19 @@ def test_remove_server_tools(registry, mock_tools):
     assert len(registry.all_tools) == 2  # No change
 
 
+def test_all_tools_rebuilt_after_changes(registry, mock_tools):
+    """Test all_tools is cached between reads and follows registry changes."""
+    registry.register_server_tools("server1", [mock_tools[0]])
+    registry.register_server_tools("server2", [mock_tools[1]])
+
+    all_tools = registry.all_tools
+    assert all_tools == mock_tools
+    assert registry.all_tools is all_tools
+
+    registry.remove_server_tools("server1")
+    assert registry.all_tools == [mock_tools[1]]
+
+
 def test_find_tool_server(registry, mock_tools):
     """Test finding which server hosts a tool."""
     registry.register_server_tools("server1", [mock_tools[0]])
@@ -94,6 +107,37 @@ def test_find_tool_server(registry, mock_tools):
     assert registry.find_tool_server("nonexistent") is None
 
 
+def test_find_tool_server_tracks_registry_changes(registry, mock_tools):
+    """Test tool lookup stays in sync with re-registration and removal."""
+    registry.register_server_tools("server1", mock_tools)
+    registry.register_server_tools("server2", mock_tools)
+
+    # Re-registering server1 without tool2 leaves tool2 only on server2
+    registry.register_server_tools("server1", [mock_tools[0]])
+    assert registry.find_tool_server("tool2") == "server2"
+
+    registry.remove_server_tools("server2")
+    assert registry.find_tool_server("tool1") == "server1"
+    assert registry.find_tool_server("tool2") is None
+
+    registry.clear()
+    assert registry.find_tool_server("tool1") is None
+
+
+def test_find_tool_server_duplicate_names(registry, mock_tools, caplog):
+    """Test the first server providing a tool name keeps it until removed."""
+    registry.register_server_tools("server1", mock_tools)
+    with caplog.at_level("WARNING", logger="agentical.mcp.tool_registry"):
+        registry.register_server_tools("server2", mock_tools)
+
+    assert registry.find_tool_server("tool1") == "server1"
+    assert "Tool name already provided by another server" in caplog.text
+
+    registry.remove_server_tools("server1")
+    assert registry.find_tool_server("tool1") == "server2"
+    assert registry.find_tool_server("tool2") == "server2"
+
+
 def test_clear_registry(registry, mock_tools):
     """Test clearing all tools from the registry."""
     # Setup initial state
@@ -120,3 +164,35 @@ def test_get_server_tools(registry, mock_tools):
     # Get tools for nonexistent server
     tools = registry.get_server_tools("nonexistent")
     assert tools == []
+
+
+def test_tools_view(registry, mock_tools):
+    """Test the snapshot view over registered tools."""
+    assert len(registry.tools_view()) == 0
+
+    registry.register_server_tools("server1", [mock_tools[0]])
+    registry.register_server_tools("server2", [mock_tools[1]])
+
+    view = registry.tools_view()
+    assert registry.tools_view() is view
+    assert len(view) == 2
+    assert list(view) == mock_tools
+    assert "tool1" in view
+    assert mock_tools[1] in view
+    assert "nonexistent" not in view
+
+    # Later registry changes do not affect a view that is already handed out
+    registry.remove_server_tools("server1")
+    assert list(view) == mock_tools
+    assert "tool1" in view
+    assert list(registry.tools_view()) == [mock_tools[1]]
+    assert "tool1" not in registry.tools_view()
+
+
+def test_get_tool(mock_tools):
+    """Test getting a tool by name from the server that serves it."""
+    registry = ToolRegistry()
+    registry.register_server_tools("server1", mock_tools)
+
+    assert registry.get_tool("tool2") is mock_tools[1]
+    assert registry.get_tool("nonexistent") is None
@@ -0,0 +1,47 @@
+"""Tests for IdentityCache."""
+
+import gc
+from unittest.mock import Mock
+
+from agentical.utils.identity_cache import IdentityCache
+
+
+class Item:
+    """Weak-referenceable, unhashable test object."""
+
+    __hash__ = None
+
+    def __init__(self, value):
+        self.value = value
+
+
+def test_get_computes_once_per_object():
+    """Test values are computed once per object and keyed by identity."""
+    cache = IdentityCache()
+    compute = Mock(side_effect=lambda item: item.value * 2)
+    first, second = Item(1), Item(1)
+
+    assert cache.get(first, compute) == 2
+    assert cache.get(first, compute) == 2
+    assert compute.call_count == 1
+
+    # Equal but distinct objects get their own entry
+    assert cache.get(second, compute) == 2
+    assert compute.call_count == 2
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_entries_dropped_when_object_collected():
+    """Test entries do not outlive their objects."""
+    cache = IdentityCache()
+    item = Item(1)
+    cache.get(item, lambda i: i.value)
+    assert len(cache) == 1
+
+    del item
+    gc.collect()
+
+    assert len(cache) == 0
@@ -0,0 +1,45 @@
+"""Tests for BoundedLRUCache."""
+
+import pytest
+
+from agentical.utils.lru_cache import BoundedLRUCache
+
+
+class PairCache(BoundedLRUCache[str]):
+    """Cache keyed by an unordered pair of names."""
+
+    @staticmethod
+    def _key(first, second):
+        return frozenset((first, second))
+
+
+def test_key_built_by_subclass():
+    """Test lookups go through the subclass key."""
+    cache = PairCache(maxsize=2)
+    cache.put("a", "b", "ab")
+
+    assert cache.get("b", "a") == "ab"
+    assert cache.get("a", "c") is None
+
+
+def test_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when full."""
+    cache = PairCache(maxsize=2)
+    cache.put("a", "b", "ab")
+    cache.put("a", "c", "ac")
+
+    assert cache.get("a", "b") == "ab"
+    cache.put("a", "d", "ad")
+
+    assert len(cache) == 2
+    assert cache.get("a", "c") is None
+    assert cache.get("a", "b") == "ab"
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_rejects_non_positive_maxsize():
+    """Test maxsize must be positive."""
+    with pytest.raises(ValueError):
+        PairCache(maxsize=0)